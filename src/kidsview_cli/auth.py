@@ -2,8 +2,6 @@ from __future__ import annotations
 
 import asyncio
 
-from pycognito import Cognito
-
 from .config import Settings
 from .session import AuthTokens
 
@@ -32,6 +30,8 @@ class AuthClient:
         )
 
     def _login_sync(self, username: str, password: str) -> AuthTokens:
+        from pycognito import Cognito  # noqa: PLC0415 - pulls in boto3, load on use
+
         user = Cognito(
             user_pool_id=self.settings.user_pool_id,
             client_id=self.settings.client_id,
@@ -61,6 +61,8 @@ class AuthClient:
         return await asyncio.to_thread(self._refresh_sync, refresh_token)
 
     def _refresh_sync(self, refresh_token: str) -> AuthTokens:
+        from pycognito import Cognito  # noqa: PLC0415 - pulls in boto3, load on use
+
         user = Cognito(
             user_pool_id=self.settings.user_pool_id,
             client_id=self.settings.client_id,
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+if TYPE_CHECKING:
+    import sqlite3
+
+
+def cache_key(query: str, variables: dict[str, Any] | None, *scope: str) -> str:
+    """Key a response by query text, variables and scope (endpoint, context, user)."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(query.encode())
+    digest.update(orjson.dumps(variables or {}, option=orjson.OPT_SORT_KEYS))
+    for part in scope:
+        digest.update(b"\0")
+        digest.update(part.encode())
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """Short-lived on-disk cache of read-only GraphQL responses (SQLite)."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # sqlite3 is only needed when caching is enabled; keep it off the CLI import path.
+        import sqlite3  # noqa: PLC0415
+
+        if not self.path.exists():
+            # Responses hold personal data; create the file owner-only before SQLite opens it.
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.touch(mode=0o600)
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, stored REAL NOT NULL, body BLOB NOT NULL)"
+            )
+            yield conn
+
+    def get(self, key: str, ttl: float) -> dict[str, Any] | None:
+        if not self.path.exists():
+            return None
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT body FROM responses WHERE key = ? AND stored >= ?",
+                (key, time.time() - ttl),
+            ).fetchone()
+        if row is None:
+            return None
+        data = orjson.loads(row[0])
+        return data if isinstance(data, dict) else None
+
+    def put(self, key: str, data: dict[str, Any], ttl: float) -> None:
+        """Store a response and drop entries older than `ttl` (e.g. from a previous login)."""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses WHERE stored < ?", (now - ttl,))
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, stored, body) VALUES (?, ?, ?)",
+                (key, now, orjson.dumps(data)),
+            )
+
+    def clear(self) -> None:
+        if not self.path.exists():
+            return
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
@@ -1,43 +1,76 @@
 # ruff: noqa: B008
 from __future__ import annotations
 
-import json
+import importlib
+from collections.abc import Iterator
+from datetime import date, timedelta
 from pathlib import Path
 from typing import Any
 
+import orjson
 import typer
-from rich.pretty import Pretty
-from rich.table import Table
+import typer.main
+from typer.core import TyperCommand, TyperGroup
 
 from . import queries
 from .auth import AuthClient, AuthError
 from .client import ApiError
-from .commands.calendar import register_calendar
-from .commands.chat import register_chat
-from .commands.galleries import register_galleries
-from .commands.notifications import register_notifications
-from .commands.payments import register_payments
-from .config import Settings
+from .config import get_settings
 from .context import Context, ContextStore
 from .helpers import (
+    AFTER_OPTION,
+    EMPTY,
+    JSON_OPTION,
+    PAGES_OPTION,
+    YES_NO,
     console,
     run_query_table,
 )
+from .helpers import (
+    cell as _cell,
+)
 from .helpers import (
     env as _env,
 )
 from .helpers import (
     execute_graphql as _execute_graphql,
 )
+from .helpers import (
+    execute_graphql_ops as _execute_graphql_ops,
+)
 from .helpers import (
     fetch_me as _fetch_me,
 )
+from .helpers import (
+    fetch_me_and_years as _fetch_me_and_years,
+)
 from .helpers import (
     fetch_years as _fetch_years,
 )
+from .helpers import (
+    field_cells as _field_cells,
+)
+from .helpers import (
+    forget_child_name as _forget_child_name,
+)
+from .helpers import (
+    full_name as _full_name,
+)
+from .helpers import (
+    load_context as _load_context,
+)
+from .helpers import (
+    load_session as _load_session,
+)
 from .helpers import (
     normalize_date as _normalize_date,
 )
+from .helpers import (
+    print_json as _print_json,
+)
+from .helpers import (
+    print_table as _print_table,
+)
 from .helpers import (
     prompt_choice as _prompt_choice,
 )
@@ -49,12 +82,67 @@ from .helpers import (
 )
 from .session import SessionStore
 
-app = typer.Typer(help="Kidsview CLI for humans and automation.")
-register_calendar(app)
-register_chat(app)
-register_galleries(app)
-register_notifications(app)
-register_payments(app)
+# Commands living in kidsview_cli.commands.<module>, registered by register_<module>(app)
+# the first time one is run. The summary is what --help and completion list, so neither
+# has to import the module; keep it equal to the command docstring (tests check both).
+LAZY_COMMANDS: dict[str, tuple[str, str]] = {
+    "quick-calendar": (
+        "calendar",
+        "Fetch quick calendar overview (has events/new/holiday/absent).",
+    ),
+    "calendar": ("calendar", "Fetch calendar entries."),
+    "schedule": ("calendar", "Fetch schedule for a group."),
+    "chat-threads": ("chat", "List chat threads."),
+    "chat-messages": ("chat", "List messages in a thread."),
+    "chat-users": ("chat", "Fetch users available for chat."),
+    "chat-search": ("chat", "Search chat groups and parents (groupsForChat)."),
+    "chat-send": ("chat", "Send a chat message (creates a thread)."),
+    "galleries": ("galleries", "Fetch galleries."),
+    "gallery-download": ("galleries", "Download gallery images."),
+    "gallery-like": ("galleries", "Toggle like for a gallery."),
+    "gallery-comment": ("galleries", "Add comment to a gallery."),
+    "unread": ("notifications", "Fetch unread notification/message counts."),
+    "notifications": ("notifications", "Fetch notifications."),
+    "notification-prefs": ("notifications", "Show or update notification preferences."),
+    "payments": ("payments", "Fetch payments history."),
+    "payments-summary": ("payments", "Fetch payments summary (balances per child)."),
+    "payment-orders": ("payments", "Fetch payment orders."),
+    "payment-components": ("payments", "List payment components."),
+    "billing-periods": ("payments", "List billing periods."),
+    "employee-billing-periods": ("payments", "List billing periods for employees (if permitted)."),
+    "tuition-discounts": ("payments", "List tuition discounts (if available)."),
+    "employee-roles": ("payments", "List employee roles (if permitted)."),
+    "employees": ("payments", "List employees (basic fields)."),
+}
+
+
+class LazyGroup(TyperGroup):
+    """Root group that imports a command module only when one of its commands is run."""
+
+    # ctx is Any: newer Typer vendors click, so its Context type has no portable import path.
+    def list_commands(self, ctx: Any) -> list[str]:
+        return list(dict.fromkeys([*LAZY_COMMANDS, *super().list_commands(ctx)]))
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        if cmd_name in self.commands or cmd_name not in LAZY_COMMANDS:
+            return super().get_command(ctx, cmd_name)
+        # Listing only (help, completion): a stub carrying the summary is enough.
+        return TyperCommand(cmd_name, help=LAZY_COMMANDS[cmd_name][1])
+
+    def resolve_command(self, ctx: Any, args: list[str]) -> Any:
+        if args and args[0] in LAZY_COMMANDS and args[0] not in self.commands:
+            self._load(LAZY_COMMANDS[args[0]][0])
+        return super().resolve_command(ctx, args)
+
+    def _load(self, module_name: str) -> None:
+        module = importlib.import_module(f"{__package__}.commands.{module_name}")
+        commands = typer.Typer()
+        getattr(module, f"register_{module_name}")(commands)
+        for name, command in typer.main.get_group(commands).commands.items():
+            self.add_command(command, name)
+
+
+app = typer.Typer(cls=LazyGroup, help="Kidsview CLI for humans and automation.")
 
 
 @app.command()
@@ -67,7 +155,7 @@ def login(
     json_output: bool = typer.Option(False, "--json", help="Print tokens as JSON."),
 ) -> None:
     """Authenticate with Kidsview and cache tokens."""
-    settings = Settings()
+    settings = get_settings()
     store = SessionStore(settings.session_file)
     client = AuthClient(settings)
     try:
@@ -78,9 +166,12 @@ def login(
 
     if save:
         store.save(tokens)
+        _load_session.cache_clear()
+        # The cached child name belongs to whoever was logged in before.
+        _forget_child_name(settings)
         console.print(f"[green]Authenticated.[/green] Tokens saved to {store.path}")
     if json_output or not save:
-        console.print_json(data=tokens.model_dump())
+        _print_json(tokens.model_dump(mode="json"))
 
 
 @app.command()
@@ -88,7 +179,7 @@ def refresh(
     json_output: bool = typer.Option(False, "--json/--no-json", help="Print tokens as JSON."),
 ) -> None:
     """Refresh tokens using cached refresh token."""
-    settings = Settings()
+    settings = get_settings()
     store = SessionStore(settings.session_file)
     tokens = store.load()
     if not tokens or not tokens.refresh_token:
@@ -101,15 +192,16 @@ def refresh(
         raise typer.Exit(code=1) from exc
 
     store.save(new_tokens)
+    _load_session.cache_clear()
     console.print(f"[green]Tokens refreshed.[/green] Saved to {store.path}")
     if json_output:
-        console.print_json(data=new_tokens.model_dump())
+        _print_json(new_tokens.model_dump(mode="json"))
 
 
 @app.command()
 def session(show_tokens: bool = typer.Option(False, "--show-tokens")) -> None:
     """Show session file location and optionally the cached tokens."""
-    settings = Settings()
+    settings = get_settings()
     store = SessionStore(settings.session_file)
     tokens = store.load()
     console.print(f"Session file: {store.path}")
@@ -117,7 +209,7 @@ def session(show_tokens: bool = typer.Option(False, "--show-tokens")) -> None:
         console.print("No cached tokens.")
         return
     if show_tokens:
-        console.print_json(data=tokens.model_dump())
+        _print_json(tokens.model_dump(mode="json"))
     else:
         console.print("Tokens cached. Use --show-tokens to display them.")
 
@@ -132,16 +224,17 @@ def context(  # noqa: PLR0913, PLR0912, PLR0915
     change: bool = typer.Option(
         False, "--change", help="Re-pick context interactively even if already set."
     ),
-    json_output: bool = typer.Option(False, "--json/--no-json"),
+    json_output: bool = JSON_OPTION,
 ) -> None:
     """Set/show context (preschool, child, year) used to build cookies automatically."""
-    settings = Settings()
+    settings = get_settings()
     store = SessionStore(settings.session_file)
     tokens = store.load()
     ctx_store = ContextStore(settings.context_file)
 
     if clear:
         ctx_store.delete()
+        _load_context.cache_clear()
         console.print("[green]Context cleared.[/green]")
         return
 
@@ -155,33 +248,46 @@ def context(  # noqa: PLR0913, PLR0912, PLR0915
         ctx = Context(locale=ctx.locale)
 
     if auto:
-        try:
-            me_data = _fetch_me(settings, tokens, ctx)
-        except ApiError as exc:
-            console.print(f"[red]GraphQL error (auto context / me):[/red] {exc}")
-            raise typer.Exit(code=1) from exc
-        me_payload: dict[str, Any] = me_data.get("me", {}) if isinstance(me_data, dict) else {}
-        children = me_payload.get("children") or []
-        preschools = me_payload.get("availablePreschools") or []
-        if children and ctx.child_id is None:
-            ctx.child_id = (
-                children[0].get("id")
-                if len(children) == 1
-                else _prompt_choice(children, "Children", "name")
-            )
-        if preschools and ctx.preschool_id is None:
-            ctx.preschool_id = (
-                preschools[0].get("id")
-                if len(preschools) == 1
-                else _prompt_choice(preschools, "Preschools", "name")
-            )
-        try:
-            years_data = _fetch_years(settings, tokens, ctx)
-        except ApiError as exc:
-            console.print(f"[red]GraphQL error (auto context / years):[/red] {exc}")
-            raise typer.Exit(code=1) from exc
-        years_payload: dict[str, Any] = years_data if isinstance(years_data, dict) else {}
-        years_list = years_payload.get("years") or []
+        # Only fetch what the saved context is missing; a complete context needs no requests.
+        need_me = ctx.child_id is None or ctx.preschool_id is None
+        need_years = ctx.year_id is None
+        # Years are scoped by the preschool cookie, so they can ride along with `me`
+        # in one request only when the preschool is already known.
+        batched = need_me and need_years and ctx.preschool_id is not None
+        years_data: dict[str, Any] = {}
+        if need_me:
+            fetch = _fetch_me_and_years if batched else _fetch_me
+            try:
+                me_data = fetch(settings, tokens, ctx)
+            except ApiError as exc:
+                console.print(f"[red]GraphQL error (auto context / me):[/red] {exc}")
+                raise typer.Exit(code=1) from exc
+            me_payload: dict[str, Any] = me_data.get("me") or {}
+            children = me_payload.get("children") or []
+            preschools = me_payload.get("availablePreschools") or []
+            if children and ctx.child_id is None:
+                ctx.child_id = (
+                    children[0].get("id")
+                    if len(children) == 1
+                    else _prompt_choice(children, "Children", "name")
+                )
+                chosen = next((c for c in children if c.get("id") == ctx.child_id), None)
+                ctx.child_name = (_full_name(chosen) or None) if chosen else None
+            if preschools and ctx.preschool_id is None:
+                ctx.preschool_id = (
+                    preschools[0].get("id")
+                    if len(preschools) == 1
+                    else _prompt_choice(preschools, "Preschools", "name")
+                )
+            if batched:
+                years_data = me_data
+        if need_years and not batched:
+            try:
+                years_data = _fetch_years(settings, tokens, ctx)
+            except ApiError as exc:
+                console.print(f"[red]GraphQL error (auto context / years):[/red] {exc}")
+                raise typer.Exit(code=1) from exc
+        years_list = years_data.get("years") or []
         if years_list and ctx.year_id is None:
             ctx.year_id = (
                 years_list[0].get("id")
@@ -189,18 +295,22 @@ def context(  # noqa: PLR0913, PLR0912, PLR0915
                 else _prompt_choice(years_list, "Lata", "displayName")
             )
 
-    if child_id:
+    if child_id and child_id != ctx.child_id:
         ctx.child_id = child_id
+        ctx.child_name = None
     if preschool_id:
         ctx.preschool_id = preschool_id
     if year_id:
         ctx.year_id = year_id
 
     ctx_store.save(ctx)
-    payload = {"context": ctx.model_dump()}
+    _load_context.cache_clear()
     if json_output:
-        console.print_json(data=payload)
+        # pydantic serializes the model itself; orjson only wraps it in the envelope.
+        _print_json({"context": orjson.Fragment(ctx.model_dump_json())})
     else:
+        from rich.table import Table  # noqa: PLC0415
+
         ctx_table = Table(title="🧭 Context", show_header=False)
         ctx_table.add_row("Child ID", str(ctx.child_id or "-"))
         ctx_table.add_row("Preschool ID", str(ctx.preschool_id or "-"))
@@ -209,24 +319,26 @@ def context(  # noqa: PLR0913, PLR0912, PLR0915
         console.print(ctx_table)
 
 
+_ME_LABELS = ("ID", "Full name", "Email", "Phone", "Position", "Type")
+_ME_CELLS = _field_cells("id", "fullName", "email", "phone", "userPosition", "userType")
+
+
 @app.command()
-def me(json_output: bool = typer.Option(False, "--json/--no-json")) -> None:  # noqa: PLR0912, PLR0915
+def me(json_output: bool = JSON_OPTION) -> None:  # noqa: PLR0912, PLR0915
     """Fetch current user profile and context."""
     settings, tokens, context = _env()
     data = _fetch_me(settings, tokens, context)
     payload = {"me": data.get("me")}
     if json_output:
-        console.print_json(data=payload)
+        _print_json(payload)
         return
 
+    from rich.table import Table  # noqa: PLC0415
+
     me_data: dict[str, Any] = payload.get("me") or {}
     summary = Table(title="🙋 Me", show_header=False)
-    summary.add_row("ID", str(me_data.get("id", "")))
-    summary.add_row("Full name", str(me_data.get("fullName", "")))
-    summary.add_row("Email", str(me_data.get("email", "")))
-    summary.add_row("Phone", str(me_data.get("phone", "")))
-    summary.add_row("Position", str(me_data.get("userPosition", "")))
-    summary.add_row("Type", str(me_data.get("userType", "")))
+    for label, value in zip(_ME_LABELS, _ME_CELLS(me_data), strict=True):
+        summary.add_row(label, value)
     unread = []
     if me_data.get("unreadNotificationsCount") is not None:
         unread.append(f"notifications: {me_data['unreadNotificationsCount']}")
@@ -238,53 +350,43 @@ def me(json_output: bool = typer.Option(False, "--json/--no-json")) -> None:  #
 
     children = me_data.get("children") or []
     if children:
-        ctable = Table(title="👶 Children")
-        ctable.add_column("ID")
-        ctable.add_column("Name")
-        ctable.add_column("Surname")
-        ctable.add_column("Group")
-        ctable.add_column("Balance")
-        for child in children:
-            group_name = (child.get("group") or {}).get("name", "")
-            balance = child.get("balance", "")
-            ctable.add_row(
-                str(child.get("id", "")),
-                str(child.get("name", "")),
-                str(child.get("surname", "")),
-                str(group_name),
-                str(balance),
+        child_rows = [
+            (
+                _cell(get("id")),
+                _cell(get("name")),
+                _cell(get("surname")),
+                _cell((get("group") or EMPTY).get("name")),
+                _cell(get("balance")),
             )
-        console.print(ctable)
+            for get in (child.get for child in children)
+        ]
+        _print_table("👶 Children", child_rows, ["ID", "Name", "Surname", "Group", "Balance"])
 
     preschools = me_data.get("availablePreschools") or []
     if preschools:
-        ptable = Table(title="🏫 Preschools")
-        ptable.add_column("ID")
-        ptable.add_column("Name")
-        ptable.add_column("Phone")
-        ptable.add_column("Email")
-        ptable.add_column("Address")
-        for pre in preschools:
-            ptable.add_row(
-                str(pre.get("id", "")),
-                str(pre.get("name", "")),
-                str(pre.get("phone", "")),
-                str(pre.get("email", "")),
-                str(pre.get("address", "")),
+        preschool_rows = [
+            (
+                _cell(get("id")),
+                _cell(get("name")),
+                _cell(get("phone")),
+                _cell(get("email")),
+                _cell(get("address")),
             )
-        console.print(ptable)
+            for get in (pre.get for pre in preschools)
+        ]
+        _print_table("🏫 Preschools", preschool_rows, ["ID", "Name", "Phone", "Email", "Address"])
 
+    # Preschools by ID (insertion-ordered, so the first key is the default preschool).
+    pre_by_id = {_cell(pre.get("id")): pre for pre in preschools if pre}
     preschool_id = context.preschool_id if context else None
-    if not preschool_id and preschools:
-        preschool_id = str((preschools[0] or {}).get("id", "")) or None
+    if not preschool_id:
+        preschool_id = next(iter(pre_by_id), "") or None
 
     years_list: list[dict[str, Any]] | None = None
     if preschool_id:
-        for pre in preschools:
-            if str(pre.get("id", "")) == preschool_id:
-                edges = (pre.get("years") or {}).get("edges") or []
-                years_list = [e.get("node", {}) for e in edges if e.get("node")]
-                break
+        if (pre := pre_by_id.get(preschool_id)) is not None:
+            edges = (pre.get("years") or {}).get("edges") or []
+            years_list = [e.get("node", {}) for e in edges if e.get("node")]
         if not years_list:
             years_ctx = context or Context(preschool_id=preschool_id)
             if years_ctx.preschool_id != preschool_id:
@@ -296,45 +398,66 @@ def me(json_output: bool = typer.Option(False, "--json/--no-json")) -> None:  #
                 )
             try:
                 years_data = _fetch_years(settings, tokens, years_ctx)
-                years_list = years_data.get("years") if isinstance(years_data, dict) else None
+                years_list = years_data.get("years")
             except ApiError:
                 years_list = None
     if years_list:
-        ytable = Table(title="📆 Years")
-        ytable.add_column("ID")
-        ytable.add_column("Display")
-        ytable.add_column("Start")
-        ytable.add_column("End")
-        for y in years_list:
-            ytable.add_row(
-                str(y.get("id", "")),
-                str(y.get("displayName", "")),
-                str(y.get("startDate", "")),
-                str(y.get("endDate", "")),
+        year_rows = [
+            (
+                _cell(y.get("id")),
+                _cell(y.get("displayName")),
+                _cell(y.get("startDate")),
+                _cell(y.get("endDate")),
             )
-        console.print(ytable)
+            for y in years_list
+        ]
+        _print_table("📆 Years", year_rows, ["ID", "Display", "Start", "End"])
+
+
+_ACTIVE_CHILD_CELLS = _field_cells(
+    "id",
+    "status",
+    "preschool.name",
+    "group.name",
+    "balance",
+    "technicalAccount",
+    "individualNumber",
+    "dietCategory.name",
+    "pinCode",
+)
 
 
 def _print_active_child(child: dict[str, Any]) -> None:
+    from rich.table import Table  # noqa: PLC0415
+
     summary = Table(title="👧 Active child", show_header=False)
-    preschool = (child.get("preschool") or {}).get("name", "")
-    group = (child.get("group") or {}).get("name", "")
-    summary.add_row("ID", str(child.get("id", "")))
-    summary.add_row("Full name", f"{child.get('name','')} {child.get('surname','')}".strip())
-    summary.add_row("Status", str(child.get("status", "")))
-    summary.add_row("Preschool", str(preschool))
-    summary.add_row("Group", str(group))
-    summary.add_row("Balance", str(child.get("balance", "")))
-    summary.add_row("Technical account", str(child.get("technicalAccount", "")))
-    summary.add_row("Individual number", str(child.get("individualNumber", "")))
+    (
+        child_id,
+        status,
+        preschool,
+        group,
+        balance,
+        technical_account,
+        individual_number,
+        diet,
+        pin,
+    ) = _ACTIVE_CHILD_CELLS(child)
+    summary.add_row("ID", child_id)
+    summary.add_row("Full name", _full_name(child))
+    summary.add_row("Status", status)
+    summary.add_row("Preschool", preschool)
+    summary.add_row("Group", group)
+    summary.add_row("Balance", balance)
+    summary.add_row("Technical account", technical_account)
+    summary.add_row("Individual number", individual_number)
     summary.add_row(
         "Contract",
         f"{child.get('contractStartDate','')} → {child.get('contractEndDate','')}".strip(),
     )
-    summary.add_row("Diet", str((child.get("dietCategory") or {}).get("name", "")))
-    exclusions = ", ".join(e.get("name", "") for e in (child.get("exclusions") or []))
+    summary.add_row("Diet", diet)
+    exclusions = ", ".join([_cell(e.get("name")) for e in child.get("exclusions") or ()])
     summary.add_row("Exclusions", exclusions or "-")
-    summary.add_row("PIN", str(child.get("pinCode", "")))
+    summary.add_row("PIN", pin)
     console.print(summary)
 
 
@@ -345,7 +468,7 @@ def active_child(
         None, help="Start date (YYYY-MM-DD) for daily activities."
     ),
     date_to: str | None = typer.Option(None, help="End date (YYYY-MM-DD) for daily activities."),
-    json_output: bool = typer.Option(False, "--json/--no-json"),
+    json_output: bool = JSON_OPTION,
 ) -> None:
     """Fetch active child summary or detailed info (requires date range)."""
     settings, tokens, context = _env()
@@ -362,7 +485,7 @@ def active_child(
     data = _execute_graphql(settings, tokens, query, variables, context, label="activeChild")
     payload = {"activeChild": data.get("activeChild")}
     if json_output:
-        console.print_json(data=payload)
+        _print_json(payload)
     else:
         child = payload.get("activeChild") or {}
         if not child:
@@ -384,36 +507,47 @@ def graphql(
 
     if query.startswith("@"):
         path = Path(query[1:])
-        if not path.exists():
+        try:
+            query_text = path.read_text()
+        except FileNotFoundError as exc:
             console.print(f"[red]Query file not found:[/red] {path}")
-            raise typer.Exit(code=1)
-        query_text = path.read_text()
+            raise typer.Exit(code=1) from exc
     else:
         query_text = query
 
     variables_payload = None
     if variables:
         try:
-            variables_payload = json.loads(variables)
-        except json.JSONDecodeError as exc:
+            variables_payload = orjson.loads(variables)
+        except orjson.JSONDecodeError as exc:
             console.print(f"[red]Invalid JSON for variables:[/red] {exc}")
             raise typer.Exit(code=1) from exc
+        if not isinstance(variables_payload, dict):
+            console.print("[red]Variables must be a JSON object.[/red]")
+            raise typer.Exit(code=1)
 
     result = _execute_graphql(settings, tokens, query_text, variables_payload, context)
 
     if json_output:
-        console.print_json(data=result)
+        _print_json(result)
     else:
+        from rich.pretty import Pretty  # noqa: PLC0415
+
         console.print(Pretty(result))
 
 
+_ANNOUNCEMENT_CELLS = _field_cells("title", "created", "createdBy.fullName")
+
+
 @app.command()
-def announcements(
+def announcements(  # noqa: PLR0913
+    *,
     first: int = typer.Option(10, help="Items to fetch."),
-    after: str | None = typer.Option(None, help="Cursor for pagination."),
+    after: str | None = AFTER_OPTION,
     status: str = typer.Option("ACTIVE", help="AnnouncementStatus."),
     phrase: str = typer.Option("", help="Search phrase."),
-    json_output: bool = typer.Option(False, "--json/--no-json"),
+    pages: int = PAGES_OPTION,
+    json_output: bool = JSON_OPTION,
 ) -> None:
     """Fetch announcements."""
     variables: dict[str, object] = {
@@ -424,21 +558,10 @@ def announcements(
     }
     headers = ["Title", "Created", "Author", "Text"]
 
-    def _rows(payload: dict[str, Any]) -> list[list[str]]:
-        conn = payload.get("announcements") or {}
-        edges = conn.get("edges") or []
-        rows_local: list[list[str]] = []
-        for item in edges:
-            node = item.get("node", {}) or {}
-            rows_local.append(
-                [
-                    str(node.get("title", "")),
-                    str(node.get("created", "")),
-                    str((node.get("createdBy") or {}).get("fullName", "")),
-                    _truncate(str(node.get("text", "")), 120),
-                ]
-            )
-        return rows_local
+    def _rows(payload: dict[str, Any]) -> Iterator[tuple[str, ...]]:
+        for item in (payload.get("announcements") or EMPTY).get("edges") or []:
+            node = item.get("node") or EMPTY
+            yield (*_ANNOUNCEMENT_CELLS(node), _truncate(_cell(node.get("text")), 120))
 
     run_query_table(
         query=queries.ANNOUNCEMENTS,
@@ -450,17 +573,20 @@ def announcements(
         title="📢 Announcements",
         rows_fn=_rows,
         show_lines=True,
+        pages=pages,
     )
 
 
 @app.command()
 def monthly_bills(  # noqa: PLR0913
+    *,
     year: str = typer.Option("", help="Year node ID (e.g., WWVhck5vZGU6MjM4OA==)."),
     child: str | None = typer.Option(None, help="Child ID."),
     unpaid: bool = typer.Option(False, "--unpaid", help="Show only unpaid bills."),
     first: int = typer.Option(10, help="Items to fetch."),
-    after: str | None = typer.Option(None, help="Cursor for pagination."),
-    json_output: bool = typer.Option(False, "--json/--no-json"),
+    after: str | None = AFTER_OPTION,
+    pages: int = PAGES_OPTION,
+    json_output: bool = JSON_OPTION,
 ) -> None:
     """Fetch monthly bills."""
     variables = {
@@ -472,30 +598,20 @@ def monthly_bills(  # noqa: PLR0913
     }
     headers = ["Payment due", "Child", "Full amount", "Paid amount", "Balance"]
 
-    def _rows(payload: dict[str, Any]) -> list[list[str]]:
-        bills_raw = payload.get("monthlyBills") or {}
-        bills: dict[str, Any] = bills_raw if isinstance(bills_raw, dict) else {}
-        edges = bills.get("edges") or []
-        rows_local: list[list[str]] = []
-        for item in edges:
-            node_raw = item.get("node", {})
-            node: dict[str, Any] = node_raw if isinstance(node_raw, dict) else {}
-            child_raw = node.get("child") or {}
-            child_info: dict[str, Any] = child_raw if isinstance(child_raw, dict) else {}
-            rows_local.append(
-                [
-                    str(node.get("paymentDueTo", "")),
-                    f"{child_info.get('name','')} {child_info.get('surname','')}".strip(),
-                    str(node.get("fullAmount", "")),
-                    str(node.get("paidAmount", "")),
-                    str(node.get("balance", "")),
-                ]
-            )
-        return rows_local
+    def _rows(payload: dict[str, Any]) -> Iterator[list[str]]:
+        # execute_graphql only hands back dict payloads; trust the schema shape per edge.
+        for item in (payload.get("monthlyBills") or EMPTY).get("edges") or []:
+            node = item.get("node") or EMPTY
+            yield [
+                _cell(node.get("paymentDueTo")),
+                _full_name(node.get("child") or EMPTY),
+                _cell(node.get("fullAmount")),
+                _cell(node.get("paidAmount")),
+                _cell(node.get("balance")),
+            ]
 
     def _title(payload: dict[str, Any]) -> str:
-        bills_raw = payload.get("monthlyBills") or {}
-        total_balance = (bills_raw or {}).get("totalBalance", "")
+        total_balance = (payload.get("monthlyBills") or EMPTY).get("totalBalance", "")
         return f"💰 Monthly bills (total balance: {total_balance})"
 
     run_query_table(
@@ -507,11 +623,12 @@ def monthly_bills(  # noqa: PLR0913
         headers=headers,
         title=_title,
         rows_fn=_rows,
+        pages=pages,
     )
 
 
 @app.command()
-def meals(json_output: bool = typer.Option(False, "--json/--no-json")) -> None:
+def meals(json_output: bool = JSON_OPTION) -> None:
     """Fetch current diet info for active child."""
     settings, tokens, context = _env()
     data = _execute_graphql(
@@ -519,20 +636,22 @@ def meals(json_output: bool = typer.Option(False, "--json/--no-json")) -> None:
     )
     payload = {"currentDietForChild": data.get("currentDietForChild")}
     if json_output:
-        console.print_json(data=payload)
+        _print_json(payload)
         return
     diet = payload.get("currentDietForChild") or {}
     if not diet:
         console.print("No diet info.")
         return
+    from rich.table import Table  # noqa: PLC0415
+
     table = Table(title="🍽️ Diet")
     table.add_column("ID")
     table.add_column("Body")
     table.add_column("Category")
     table.add_row(
-        str(diet.get("id", "")),
-        _truncate(str(diet.get("body", "")), 120),
-        str((diet.get("category") or {}).get("id", "")),
+        _cell(diet.get("id")),
+        _truncate(_cell(diet.get("body")), 120),
+        _cell((diet.get("category") or EMPTY).get("id")),
     )
     console.print(table)
 
@@ -541,7 +660,7 @@ def meals(json_output: bool = typer.Option(False, "--json/--no-json")) -> None:
 def observations(
     child_id: str = typer.Option(..., help="Child ID."),
     activity_id: str | None = typer.Option(None, help="Additional activity ID."),
-    json_output: bool = typer.Option(False, "--json/--no-json"),
+    json_output: bool = JSON_OPTION,
 ) -> None:
     """Fetch observations for additional activities for a child."""
     settings, tokens, context = _env()
@@ -555,21 +674,23 @@ def observations(
         label="observations",
     )
     if json_output:
-        console.print_json(data=data)
+        _print_json(data)
         return
     obs = data.get("additionalActivities") or {}
     edges = obs.get("edges") or []
     if not edges:
         console.print("No observations.")
         return
+    from rich.table import Table  # noqa: PLC0415
+
     table = Table(title="👀 Observations")
     table.add_column("Activity")
     table.add_column("Observation IDs")
     for edge in edges:
         node = edge.get("node") or {}
         obs_edges = (node.get("observations") or {}).get("edges") or []
-        ids = ", ".join((o.get("node") or {}).get("id", "") for o in obs_edges)
-        table.add_row(str(node.get("name", "")), ids)
+        ids = ", ".join([_cell((o.get("node") or EMPTY).get("id")) for o in obs_edges])
+        table.add_row(_cell(node.get("name")), ids)
     console.print(table)
 
 
@@ -579,7 +700,7 @@ def application_submit(
     child_id: str | None = typer.Option(None, help="Child ID (optional)."),
     comment: str | None = typer.Option(None, help="Optional director comment."),
     months: int | None = typer.Option(None, help="Number of months (if applicable)."),
-    json_output: bool = typer.Option(False, "--json/--no-json"),
+    json_output: bool = JSON_OPTION,
 ) -> None:
     """Submit an application (createApplication)."""
     settings, tokens, context = _env()
@@ -594,7 +715,7 @@ def application_submit(
         settings, tokens, queries.CREATE_APPLICATION, variables, context, label="createApplication"
     )
     if json_output:
-        console.print_json(data=data)
+        _print_json(data)
         return
     success = (data.get("createApplication") or {}).get("success")
     if success:
@@ -603,33 +724,29 @@ def application_submit(
         console.print(f"[red]Submit failed:[/red] {data}")
 
 
+_APPLICATION_CELLS = _field_cells(
+    "id",
+    "created",
+    "applicationForm.name",
+    "applicationForm.status",
+    "status",
+    "commentDirector",
+)
+
+
 @app.command()
 def applications(
     status: str | None = typer.Option(None, help="Status filter."),
     phrase: str | None = typer.Option(None, help="Search phrase."),
-    json_output: bool = typer.Option(False, "--json/--no-json"),
+    json_output: bool = JSON_OPTION,
 ) -> None:
     """Fetch applications (wnioski)."""
     variables = {"status": status, "phrase": phrase}
     headers = ["ID", "Created", "Form", "Form status", "Status", "Comment"]
 
-    def _rows(payload: dict[str, Any]) -> list[list[str]]:
-        edges = (payload.get("applications") or {}).get("edges") or []
-        rows_local: list[list[str]] = []
-        for item in edges:
-            node = item.get("node") or {}
-            form = node.get("applicationForm") or {}
-            rows_local.append(
-                [
-                    str(node.get("id", "")),
-                    str(node.get("created", "")),
-                    str(form.get("name", "")),
-                    str(form.get("status", "")),
-                    str(node.get("status", "")),
-                    str(node.get("commentDirector", "")),
-                ]
-            )
-        return rows_local
+    def _rows(payload: dict[str, Any]) -> Iterator[tuple[str, ...]]:
+        edges = (payload.get("applications") or EMPTY).get("edges") or []
+        return map(_APPLICATION_CELLS, (item.get("node") or EMPTY for item in edges))
 
     run_query_table(
         query=queries.APPLICATIONS,
@@ -643,27 +760,22 @@ def applications(
     )
 
 
+_COLOR_CELLS = _field_cells(
+    "id",
+    "name",
+    "usercolorSet.headerColor",
+    "usercolorSet.backgroundColor",
+    "usercolorSet.accentColor",
+)
+
+
 @app.command()
-def colors(json_output: bool = typer.Option(False, "--json/--no-json")) -> None:
+def colors(json_output: bool = JSON_OPTION) -> None:
     """Fetch available preschools and color scheme."""
     headers = ["ID", "Name", "Header", "Background", "Accent"]
 
-    def _rows(payload: dict[str, Any]) -> list[list[str]]:
-        me_data = payload.get("me") or {}
-        preschools = me_data.get("availablePreschools") or []
-        rows_local: list[list[str]] = []
-        for pre in preschools:
-            color = (pre.get("usercolorSet") or {}) or {}
-            rows_local.append(
-                [
-                    str(pre.get("id", "")),
-                    str(pre.get("name", "")),
-                    str(color.get("headerColor", "")),
-                    str(color.get("backgroundColor", "")),
-                    str(color.get("accentColor", "")),
-                ]
-            )
-        return rows_local
+    def _rows(payload: dict[str, Any]) -> Iterator[tuple[str, ...]]:
+        return map(_COLOR_CELLS, (payload.get("me") or EMPTY).get("availablePreschools") or [])
 
     run_query_table(
         query=queries.COLORS,
@@ -677,6 +789,70 @@ def colors(json_output: bool = typer.Option(False, "--json/--no-json")) -> None:
     )
 
 
+@app.command()
+def dashboard(
+    days: int = typer.Option(7, help="Quick calendar range: N days starting today."),
+    announcements_first: int = typer.Option(
+        5, "--announcements", help="Number of latest announcements."
+    ),
+    json_output: bool = JSON_OPTION,
+) -> None:
+    """Show unread counts, upcoming days and latest announcements."""
+    settings, tokens, context = _env()
+    today = date.today()
+    # Independent queries: sent concurrently, so the wait is the slowest one, not the sum.
+    unread_data, calendar_data, announcements_data = _execute_graphql_ops(
+        settings,
+        tokens,
+        [
+            (queries.UNREAD_COUNTS, {}),
+            (
+                queries.QUICK_CALENDAR,
+                {
+                    "groupsIds": None,
+                    "dateFrom": today.isoformat(),
+                    "dateTo": (today + timedelta(days=days)).isoformat(),
+                },
+            ),
+            (queries.ANNOUNCEMENTS, {"first": announcements_first, "status": "ACTIVE"}),
+        ],
+        context,
+        label="dashboard",
+    )
+    payload = {
+        "me": unread_data.get("me"),
+        "quickCalendar": calendar_data.get("quickCalendar"),
+        "announcements": announcements_data.get("announcements"),
+    }
+    if json_output:
+        _print_json(payload)
+        return
+
+    counts = payload["me"] or EMPTY
+    unread_notifications = _cell(counts.get("unreadNotificationsCount")) or "0"
+    unread_messages = _cell(counts.get("unreadMessagesCount")) or "0"
+    console.print(f"🔔 Unread notifications: {unread_notifications}, messages: {unread_messages}")
+    day_rows = [
+        (
+            _cell(day.get("date")),
+            YES_NO[bool(day.get("hasEvents"))],
+            YES_NO[bool(day.get("hasNewEvents"))],
+            YES_NO[bool(day.get("holiday"))],
+            YES_NO[bool(day.get("absent"))],
+        )
+        for day in payload["quickCalendar"] or []
+    ]
+    if day_rows:
+        headers = ["Date", "Has events", "New events", "Holiday", "Absent"]
+        _print_table("📅 Upcoming days", day_rows, headers)
+    announcement_rows = [
+        _ANNOUNCEMENT_CELLS(edge.get("node") or EMPTY)
+        for edge in (payload["announcements"] or EMPTY).get("edges") or []
+    ]
+    if announcement_rows:
+        _print_table("📢 Announcements", announcement_rows, ["Title", "Created", "Author"])
+
+
 @app.command()
 def absence(  # noqa: PLR0913
     child_id: str | None = typer.Option(None, help="Child ID (defaults to context child)."),
@@ -696,7 +872,7 @@ def absence(  # noqa: PLR0913
     yes: bool = typer.Option(
         False, "--yes", help="Do not prompt for confirmation (use with care)."
     ),
-    json_output: bool = typer.Option(False, "--json/--no-json"),
+    json_output: bool = JSON_OPTION,
 ) -> None:
     """Report child absence (setChildAbsence)."""
     settings, tokens, context = _env()
@@ -704,8 +880,9 @@ def absence(  # noqa: PLR0913
     if not effective_child:
         console.print("[red]Child ID required (pass --child-id or set context).[/red]")
         raise typer.Exit(code=1)
-    date_from_norm = _normalize_date(date_val)
-    date_to_norm = _normalize_date(date_to) if date_to else None
+    today = date.today()
+    date_from_norm = _normalize_date(date_val, today)
+    date_to_norm = _normalize_date(date_to, today) if date_to else None
 
     if not yes:
         console.print(
@@ -733,7 +910,7 @@ def absence(  # noqa: PLR0913
         settings, tokens, queries.SET_CHILD_ABSENCE, variables, context, label="setChildAbsence"
     )
     if json_output:
-        console.print_json(data=data)
+        _print_json(data)
         return
     success = (data.get("setChildAbsence") or {}).get("success")
     if success:
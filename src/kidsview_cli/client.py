@@ -1,66 +1,201 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+import hashlib
+import importlib.util
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from types import MappingProxyType, TracebackType
 from typing import Any
 
 import httpx
+import orjson
 
 from .config import Settings
 from .context import Context
 from .session import AuthTokens
 
+HTTP_TIMEOUT = 20.0
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+
 
 class ApiError(RuntimeError):
     """Raised when Kidsview API returns an error."""
 
 
+@lru_cache(maxsize=8)
+def _static_headers(app_url: str, locale: str, user_agent: str) -> Mapping[str, str]:
+    """Request headers that only depend on settings; built once, merged with auth per call."""
+    return MappingProxyType(
+        {
+            "Content-Type": "application/json",
+            "Accept": "application/json, text/plain, */*",
+            "Origin": app_url,
+            "Referer": f"{app_url}/",
+            "Accept-Language": f"{locale},en;q=0.8",
+            "Cache-Control": "no-cache",
+            "Pragma": "no-cache",
+            "User-Agent": user_agent,
+        }
+    )
+
+
+@lru_cache(maxsize=8)
+def _cookie_pairs(cookie_str: str) -> tuple[tuple[str, str], ...]:
+    """Parse a "name=value; ..." cookie string once per distinct value."""
+    return tuple(
+        (name.strip(), value.strip())
+        for name, _, value in (part.partition("=") for part in cookie_str.split(";") if "=" in part)
+    )
+
+
+@lru_cache(maxsize=1)
+def http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package (installed with the `fast` extra)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def new_http_client() -> httpx.AsyncClient:
+    """Create the pooled HTTP client used for GraphQL calls.
+
+    With h2 installed, concurrent requests multiplex over one HTTP/2 connection;
+    servers without HTTP/2 are still reached over HTTP/1.1 via ALPN.
+    """
+    return httpx.AsyncClient(timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS, http2=http2_available())
+
+
+@lru_cache(maxsize=128)
+def query_hash(query: str) -> str:
+    """SHA-256 of the query document, as used by automatic persisted queries."""
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+# Query hashes the server has accepted with their full document during this process.
+_PERSISTED_HASHES: set[str] = set()
+
+
+@lru_cache(maxsize=256)
+def _body_tail(query: str, persisted: bool, include_query: bool) -> bytes:
+    """Everything after the variables in the POST body, encoded once per query and mode."""
+    parts = []
+    if include_query:
+        parts += [b',"query":', orjson.dumps(query)]
+    if persisted:
+        parts += [
+            b',"extensions":{"persistedQuery":{"version":1,"sha256Hash":"',
+            query_hash(query).encode(),
+            b'"}}',
+        ]
+    parts.append(b"}")
+    return b"".join(parts)
+
+
+def encode_request(
+    query: str,
+    variables: Mapping[str, Any] | None = None,
+    *,
+    persisted: bool = False,
+    include_query: bool = True,
+) -> bytes:
+    """Build the GraphQL POST body; only the variables are serialized per call.
+
+    ``persisted`` adds the APQ ``persistedQuery`` extension; with ``include_query=False``
+    only the hash is sent in place of the query document.
+    """
+    encoded_vars = orjson.dumps(variables or {}, default=dict)
+    return b'{"variables":' + encoded_vars + _body_tail(query, persisted, include_query)
+
+
 class GraphQLClient:
-    """Thin GraphQL client for Kidsview backend."""
+    """Thin GraphQL client for Kidsview backend.
+
+    Pass ``http`` to reuse a pooled client across calls; otherwise each call opens and
+    closes its own, so separate ``asyncio.run`` calls on one instance keep working.
+    """
 
     def __init__(
-        self, settings: Settings, tokens: AuthTokens, context: Context | None = None
+        self,
+        settings: Settings,
+        tokens: AuthTokens,
+        context: Context | None = None,
+        http: httpx.AsyncClient | None = None,
     ) -> None:
         self.settings = settings
         self.tokens = tokens
         self.context = context
+        self._http = http
+
+    async def __aenter__(self) -> GraphQLClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Nothing to release: a shared ``http`` client belongs to the caller."""
 
     def _set_extra_cookies(self, client: httpx.AsyncClient) -> None:
         cookie_str = self.settings.cookies
-        if not cookie_str:
-            cookie_parts: dict[str, str] = self.context.cookies() if self.context else {}
-            if not cookie_parts:
-                return
-            cookie_str = "; ".join(f"{k}={v}" for k, v in cookie_parts.items())
-        for part in cookie_str.split(";"):
-            if "=" not in part:
-                continue
-            name, value = part.split("=", 1)
-            client.cookies.set(name.strip(), value.strip(), domain="backend.kidsview.pl")
+        pairs: Iterable[tuple[str, str]]
+        if cookie_str:
+            pairs = _cookie_pairs(cookie_str)
+        elif self.context:
+            pairs = self.context.cookies().items()
+        else:
+            return
+        for name, value in pairs:
+            client.cookies.set(name, value, domain="backend.kidsview.pl")
+
+    async def _post(
+        self, client: httpx.AsyncClient, body: bytes, headers: dict[str, str]
+    ) -> tuple[httpx.Response, Any]:
+        resp = await client.post(self.settings.api_url, content=body, headers=headers)
+        if resp.is_error:
+            raise ApiError(f"GraphQL HTTP error {resp.status_code}: {resp.text}")
+        return resp, orjson.loads(resp.content)
 
     async def execute(
         self, query: str, variables: Mapping[str, Any] | None = None
     ) -> dict[str, Any]:
+        if self._http is not None:
+            return await self._execute(self._http, query, variables)
+        async with new_http_client() as client:
+            return await self._execute(client, query, variables)
+
+    async def _execute(
+        self, client: httpx.AsyncClient, query: str, variables: Mapping[str, Any] | None
+    ) -> dict[str, Any]:
+        settings = self.settings
         base_headers = {
-            **self.tokens.authorization_header(self.settings.auth_token_preference),
-            "Content-Type": "application/json",
-            "Accept": "application/json, text/plain, */*",
-            "Origin": self.settings.app_url,
-            "Referer": f"{self.settings.app_url}/",
-            "Accept-Language": f"{self.settings.locale},en;q=0.8",
-            "Cache-Control": "no-cache",
-            "Pragma": "no-cache",
-            "User-Agent": self.settings.user_agent,
+            **_static_headers(settings.app_url, settings.locale, settings.user_agent),
+            **self.tokens.authorization_header(settings.auth_token_preference),
         }
-        payload: dict[str, Any] = {"query": query, "variables": variables or {}}
-
-        async with httpx.AsyncClient(timeout=20.0) as client:
-            self._set_extra_cookies(client)
-            resp = await client.post(self.settings.api_url, json=payload, headers=base_headers)
+        self._set_extra_cookies(client)
 
-        if resp.is_error:
-            raise ApiError(f"GraphQL HTTP error {resp.status_code}: {resp.text}")
+        persisted = settings.persisted_queries
+        resp: httpx.Response | None = None
+        data_raw: Any = None
+        if persisted and query_hash(query) in _PERSISTED_HASHES:
+            body = encode_request(query, variables, persisted=True, include_query=False)
+            try:
+                resp, data_raw = await self._post(client, body, base_headers)
+            except ApiError:
+                resp = None
+            if resp is None or not isinstance(data_raw, dict) or "errors" in data_raw:
+                # PersistedQueryNotFound, a server without APQ (HTTP 400 "Must provide query
+                # string") or any other failure: forget the hash and resend the full document.
+                _PERSISTED_HASHES.discard(query_hash(query))
+                resp = None
+        if resp is None:
+            body = encode_request(query, variables, persisted=persisted)
+            resp, data_raw = await self._post(client, body, base_headers)
+            if persisted and isinstance(data_raw, dict) and "errors" not in data_raw:
+                _PERSISTED_HASHES.add(query_hash(query))
 
-        data_raw: Any = resp.json()
         if not isinstance(data_raw, dict):
             return {}
         if "errors" in data_raw:
@@ -1,77 +1,86 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from calendar import monthrange
+from collections.abc import Iterator, Sequence
 from datetime import date, timedelta
+from operator import itemgetter
 from typing import Any
 
 import typer
 
 from .. import queries
+from ..helpers import EMPTY, JSON_OPTION, YES_NO, cell, run_query_table, split_csv
 from ..helpers import normalize_date as _normalize_date
-from ..helpers import run_query_table
 
-MONTH_LAST = 12
-
-
-def _compute_range(
-    date_from: str, date_to: str, week: bool, month: bool, days: int | None
+# Options shared by quick-calendar and calendar, built once at import.
+_DATE_FROM_OPT = typer.Option(
+    "today", help="Start date (YYYY-MM-DD) or 'today'/'tomorrow'/'yesterday'."
+)
+_DATE_TO_OPT = typer.Option(
+    "today", help="End date (YYYY-MM-DD) or 'today'/'tomorrow'/'yesterday'."
+)
+_WEEK_OPT = typer.Option(False, "--week", help="Set range to current week (Mon-Sun).")
+_MONTH_OPT = typer.Option(False, "--month", help="Set range to current month.")
+_DAYS_OPT = typer.Option(None, "--days", help="Set range to N days starting today.")
+_GROUPS_OPT = typer.Option("", help="Comma-separated group IDs.")
+
+# Scalar fields always present in a CALENDAR node (selected by the query).
+_CALENDAR_FIELDS = itemgetter("title", "startDate", "endDate", "type")
+
+
+def _compute_range(  # noqa: PLR0913
+    date_from: str,
+    date_to: str,
+    week: bool,
+    month: bool,
+    days: int | None,
+    *,
+    today: date | None = None,
 ) -> tuple[str, str]:
+    today = today or date.today()
     if days:
-        start = date.today()
-        end = start + timedelta(days=days)
-        return start.isoformat(), end.isoformat()
+        return today.isoformat(), (today + timedelta(days=days)).isoformat()
     if week:
-        today = date.today()
         start = today - timedelta(days=today.weekday())
-        end = start + timedelta(days=6)
-        return start.isoformat(), end.isoformat()
+        return start.isoformat(), (start + timedelta(days=6)).isoformat()
     if month:
-        today = date.today()
-        start = today.replace(day=1)
-        if start.month == MONTH_LAST:
-            end = start.replace(year=start.year + 1, month=1, day=1) - timedelta(days=1)
-        else:
-            end = start.replace(month=start.month + 1, day=1) - timedelta(days=1)
-        return start.isoformat(), end.isoformat()
-    return _normalize_date(date_from), _normalize_date(date_to)
+        last_day = monthrange(today.year, today.month)[1]
+        return today.replace(day=1).isoformat(), today.replace(day=last_day).isoformat()
+    return _normalize_date(date_from, today), _normalize_date(date_to, today)
 
 
 def register_calendar(app: typer.Typer) -> None:
     @app.command("quick-calendar")
     def quick_calendar(  # noqa: PLR0913
-        date_from: str = typer.Option(
-            "today", help="Start date (YYYY-MM-DD) or 'today'/'tomorrow'/'yesterday'."
-        ),
-        date_to: str = typer.Option(
-            "today", help="End date (YYYY-MM-DD) or 'today'/'tomorrow'/'yesterday'."
-        ),
-        week: bool = typer.Option(False, "--week", help="Set range to current week."),
-        month: bool = typer.Option(False, "--month", help="Set range to current month."),
-        days: int | None = typer.Option(None, "--days", help="Set range to N days starting today."),
-        groups_ids: str = typer.Option("", help="Comma-separated group IDs."),
-        json_output: bool = typer.Option(False, "--json/--no-json"),
+        date_from: str = _DATE_FROM_OPT,
+        date_to: str = _DATE_TO_OPT,
+        week: bool = _WEEK_OPT,
+        month: bool = _MONTH_OPT,
+        days: int | None = _DAYS_OPT,
+        groups_ids: str = _GROUPS_OPT,
+        json_output: bool = JSON_OPTION,
     ) -> None:
         """Fetch quick calendar overview (has events/new/holiday/absent)."""
         range_from, range_to = _compute_range(date_from, date_to, week, month, days)
         variables: dict[str, object] = {
-            "groupsIds": [g for g in groups_ids.split(",") if g] or None,
+            "groupsIds": split_csv(groups_ids) or None,
             "dateFrom": range_from,
             "dateTo": range_to,
         }
 
-        def _rows(payload: dict[str, Any]) -> list[Sequence[str]]:
+        def _rows(payload: dict[str, Any]) -> Iterator[Sequence[str]]:
             items = payload.get("quickCalendar") or []
-            return [
+            return (
                 (
-                    str(node.get("date", "")),
-                    "yes" if node.get("hasEvents") else "no",
-                    "yes" if node.get("hasNewEvents") else "no",
-                    "yes" if node.get("holiday") else "no",
-                    "yes" if node.get("absent") else "no",
-                    "yes" if node.get("mealsModified") else "no",
+                    cell(node.get("date")),
+                    YES_NO[bool(node.get("hasEvents"))],
+                    YES_NO[bool(node.get("hasNewEvents"))],
+                    YES_NO[bool(node.get("holiday"))],
+                    YES_NO[bool(node.get("absent"))],
+                    YES_NO[bool(node.get("mealsModified"))],
                 )
                 for node in items
-            ]
+            )
 
         run_query_table(
             query=queries.QUICK_CALENDAR,
@@ -86,27 +95,21 @@ def register_calendar(app: typer.Typer) -> None:
 
     @app.command()
     def calendar(  # noqa: PLR0913
-        date_from: str = typer.Option(
-            "today", help="Start date (YYYY-MM-DD) or 'today'/'tomorrow'/'yesterday'."
-        ),
-        date_to: str = typer.Option(
-            "today", help="End date (YYYY-MM-DD) or 'today'/'tomorrow'/'yesterday'."
-        ),
-        week: bool = typer.Option(False, "--week", help="Set range to current week (Mon-Sun)."),
-        month: bool = typer.Option(False, "--month", help="Set range to current month."),
-        days: int | None = typer.Option(None, "--days", help="Set range to N days starting today."),
-        groups_ids: str = typer.Option("", help="Comma-separated group IDs."),
+        date_from: str = _DATE_FROM_OPT,
+        date_to: str = _DATE_TO_OPT,
+        week: bool = _WEEK_OPT,
+        month: bool = _MONTH_OPT,
+        days: int | None = _DAYS_OPT,
+        groups_ids: str = _GROUPS_OPT,
         activity_types: str = typer.Option("0,1,5,9", help="Comma-separated activity type ints."),
         show_canceled: bool | None = typer.Option(None, help="Include canceled activities."),
         for_schedule: bool | None = typer.Option(None, help="For schedule flag."),
         activity_id: str | None = typer.Option(None, help="Specific activity ID."),
-        json_output: bool = typer.Option(False, "--json/--no-json"),
+        json_output: bool = JSON_OPTION,
     ) -> None:
         """Fetch calendar entries."""
-        groups_list = [g for g in groups_ids.split(",") if g] if groups_ids else []
-        activity_type_list = (
-            [int(x) for x in activity_types.split(",") if x.strip()] if activity_types else None
-        )
+        groups_list = split_csv(groups_ids)
+        activity_type_list = list(map(int, split_csv(activity_types))) or None
         range_from, range_to = _compute_range(date_from, date_to, week, month, days)
 
         variables: dict[str, object] = {
@@ -119,22 +122,15 @@ def register_calendar(app: typer.Typer) -> None:
             "activityId": activity_id,
         }
 
-        def _rows(payload: dict[str, Any]) -> list[Sequence[str]]:
-            items = payload.get("calendar") or []
-            rows_local: list[Sequence[str]] = []
-            for node in items:
-                reporter = (node.get("absenceReportedBy") or {}).get("fullName", "")
-                rows_local.append(
-                    (
-                        str(node.get("title", "")),
-                        str(node.get("startDate", "")),
-                        str(node.get("endDate", "")),
-                        str(node.get("type", "")),
-                        "yes" if node.get("allDay") else "no",
-                        str(reporter),
-                    )
+        def _rows(payload: dict[str, Any]) -> Iterator[Sequence[str]]:
+            return (
+                (
+                    *map(str, _CALENDAR_FIELDS(node)),
+                    YES_NO[bool(node.get("allDay"))],
+                    cell((node.get("absenceReportedBy") or EMPTY).get("fullName")),
                 )
-            return rows_local
+                for node in payload.get("calendar") or []
+            )
 
         run_query_table(
             query=queries.CALENDAR,
@@ -143,7 +139,7 @@ def register_calendar(app: typer.Typer) -> None:
             json_output=json_output,
             empty_msg="No calendar entries.",
             headers=["Title", "Start", "End", "Type", "All day", "Reported by"],
-            title=f"Calendar {range_from} to {range_to}",
+            title=lambda _payload: f"Calendar {range_from} to {range_to}",
             rows_fn=_rows,
             show_lines=True,
         )
@@ -151,28 +147,24 @@ def register_calendar(app: typer.Typer) -> None:
     @app.command()
     def schedule(
         group_id: str = typer.Option(..., "--group-id", help="Group ID for schedule (required)."),
-        json_output: bool = typer.Option(False, "--json/--no-json"),
+        json_output: bool = JSON_OPTION,
     ) -> None:
         """Fetch schedule for a group."""
         variables: dict[str, object] = {"group": group_id}
 
-        def _rows(payload: dict[str, Any]) -> list[Sequence[str]]:
+        def _rows(payload: dict[str, Any]) -> Iterator[Sequence[str]]:
             items = payload.get("schedule") or []
-            rows: list[Sequence[str]] = []
             for node in items:
                 groups = node.get("groupsNames")
                 groups_str = ", ".join(groups) if isinstance(groups, list) else str(groups or "")
-                rows.append(
-                    (
-                        str(node.get("title", "")),
-                        str(node.get("startDate", "")),
-                        str(node.get("endDate", "")),
-                        "yes" if node.get("allDay") else "no",
-                        str(node.get("type", "")),
-                        groups_str,
-                    )
+                yield (
+                    cell(node.get("title")),
+                    cell(node.get("startDate")),
+                    cell(node.get("endDate")),
+                    YES_NO[bool(node.get("allDay"))],
+                    cell(node.get("type")),
+                    groups_str,
                 )
-            return rows
 
         run_query_table(
             query=queries.SCHEDULE,
@@ -1,44 +1,100 @@
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
 from typing import Any
 
 import typer
 
 from .. import queries
-from ..helpers import console, run_query_table
+from ..helpers import (
+    AFTER_OPTION,
+    EMPTY,
+    JSON_OPTION,
+    PAGES_OPTION,
+    YES_NO,
+    console,
+    field_cells,
+    print_json,
+    run_query_table,
+    split_csv,
+)
+from ..helpers import cell as _cell
 from ..helpers import env as _env
 from ..helpers import execute_graphql as _execute_graphql
+from ..helpers import full_name as _full_name
 from ..helpers import truncate as _truncate
 
 LAST_MSG_PREVIEW = 50
 TEXT_PREVIEW = 80
 
 
-def _render_thread_row(node: dict[str, Any]) -> tuple[str, str, str, str, str, str, str]:
-    child = node.get("child") or {}
-    child_name = f"{child.get('name','')} {child.get('surname','')}".strip() if child else ""
-    recipients = ", ".join(r.get("fullName", "") for r in (node.get("recipients") or []))
-    last_msg = str(node.get("lastMessage", "")[:LAST_MSG_PREVIEW])
-    if len(str(node.get("lastMessage", ""))) > LAST_MSG_PREVIEW:
+_MESSAGE_HEADERS = (
+    "ID",
+    "Created",
+    "Sender",
+    "Read",
+    "Type",
+    "Modified",
+    "Recipients",
+    "Last message",
+    "Text",
+)
+
+
+def _message_title(payload: dict[str, Any]) -> str:
+    return f"💬 Messages in {(payload.get('thread') or {}).get('name','')}"
+
+
+_ThreadRow = tuple[str, str, str, str, str, str, str]
+
+
+def _render_thread_row(node: Mapping[str, Any]) -> _ThreadRow:
+    get = node.get
+    child = get("child") or EMPTY
+    child_name = _full_name(child)
+    recipients = ", ".join([_cell(r.get("fullName")) for r in get("recipients") or ()])
+    last_full = _cell(get("lastMessage"))
+    last_msg = last_full[:LAST_MSG_PREVIEW]
+    if len(last_full) > LAST_MSG_PREVIEW:
         last_msg += "..."
     return (
-        str(node.get("id", "")),
-        str(node.get("name", "")),
+        _cell(get("id")),
+        _cell(get("name")),
         child_name,
         recipients,
         last_msg,
-        str(node.get("type", "")),
-        str(node.get("modified", "")),
+        _cell(get("type")),
+        _cell(get("modified")),
     )
 
 
+def _thread_row(item: dict[str, Any]) -> _ThreadRow:
+    """Render a thread edge once; the row is kept on the edge for any later renderer."""
+    row: _ThreadRow | None = item.get("_row")
+    if row is None:
+        row = item["_row"] = _render_thread_row(item.get("node") or EMPTY)
+    return row
+
+
 def _rows_for_threads(edges: list[dict[str, Any]], include_id: bool = True) -> list[list[str]]:
-    rows: list[list[str]] = []
-    for item in edges:
-        node = item.get("node", {})
-        row = _render_thread_row(node)
-        rows.append(list(row if include_id else row[1:]))
-    return rows
+    return [list(row if include_id else row[1:]) for row in map(_thread_row, edges)]
+
+
+_CHAT_USER_CELLS = field_cells("chatDisplayName", "userType", "chatUserPosition", "roleName")
+
+
+def _chat_user_rows(payload: dict[str, Any]) -> Iterator[tuple[str, ...]]:
+    return map(_CHAT_USER_CELLS, payload.get("usersForChat") or [])
+
+
+def _chat_group_rows(payload: dict[str, Any]) -> Iterator[list[str]]:
+    for group in payload.get("groupsForChat") or []:
+        parents = [
+            _cell(parent.get("chatDisplayName"))
+            for child in group.get("children") or []
+            for parent in child.get("parents") or []
+        ]
+        yield [_cell(group.get("id")), _cell(group.get("name")), ", ".join(parents)]
 
 
 def _prompt_thread_selection(app: typer.Typer, edges: list[dict[str, Any]]) -> str:
@@ -55,14 +111,11 @@ def _prompt_thread_selection(app: typer.Typer, edges: list[dict[str, Any]]) -> s
     table.add_column("Type")
     table.add_column("Modified")
     for idx, item in enumerate(edges, start=1):
-        node = item.get("node", {}) or {}
-        row = _render_thread_row(node)
-        table.add_row(str(idx), *row[1:])  # skip ID in display
-        item["_resolved_id"] = row[0]
+        table.add_row(str(idx), *_thread_row(item)[1:])  # skip ID in display
     console.print(table)
     choice = typer.prompt(f"Choose a number 1-{len(edges)}", type=int)
     if 1 <= choice <= len(edges):
-        return str(edges[choice - 1].get("_resolved_id", ""))
+        return _thread_row(edges[choice - 1])[0]
     console.print("[red]Invalid choice.[/red]")
     raise typer.Exit(code=1)
 
@@ -77,8 +130,8 @@ def register_chat(app: typer.Typer) -> None:  # noqa: PLR0915
         ),
         search: str = typer.Option("", help="Search by name."),
         first: int = typer.Option(20, help="Number of threads."),
-        after: str | None = typer.Option(None, help="Cursor for pagination."),
-        json_output: bool = typer.Option(False, "--json/--no-json"),
+        after: str | None = AFTER_OPTION,
+        json_output: bool = JSON_OPTION,
     ) -> None:
         """List chat threads."""
         variables: dict[str, object] = {
@@ -106,13 +159,13 @@ def register_chat(app: typer.Typer) -> None:  # noqa: PLR0915
     def chat_messages(
         thread_id: str | None = typer.Option(None, "--thread-id", help="Thread ID (optional)."),
         first: int = typer.Option(20, help="Number of messages."),
-        after: str | None = typer.Option(None, help="Cursor for pagination."),
-        json_output: bool = typer.Option(False, "--json/--no-json"),
+        after: str | None = AFTER_OPTION,
+        pages: int = PAGES_OPTION,
+        json_output: bool = JSON_OPTION,
     ) -> None:
         """List messages in a thread."""
         settings, tokens, context = _env()
         chosen_thread = thread_id
-        threads_cache: list[dict[str, Any]] | None = None
 
         if not chosen_thread:
             data_threads = _execute_graphql(
@@ -123,36 +176,35 @@ def register_chat(app: typer.Typer) -> None:  # noqa: PLR0915
                 context,
                 label="threads",
             )
-            threads_cache = (data_threads.get("threads") or {}).get("edges") or []
-            chosen_thread = _prompt_thread_selection(app, threads_cache)
+            chosen_thread = _prompt_thread_selection(
+                app, (data_threads.get("threads") or {}).get("edges") or []
+            )
             if not chosen_thread:
                 console.print("[red]No thread selected.[/red]")
                 raise typer.Exit(code=1)
 
         variables: dict[str, object] = {"id": chosen_thread, "first": first, "after": after}
 
-        def _rows(payload: dict[str, Any]) -> list[list[str]]:
+        def _rows(payload: dict[str, Any]) -> Iterator[list[str]]:
             thread = payload.get("thread") or {}
             messages = (thread.get("messages") or {}).get("edges") or []
-            rows_local: list[list[str]] = []
+            # Thread columns repeat on every message row; format them once.
+            thread_cells = (
+                _cell(thread.get("type")),
+                _cell(thread.get("modified")),
+                ", ".join([_cell(r.get("fullName")) for r in thread.get("recipients") or ()]),
+                _truncate(_cell(thread.get("lastMessage")), LAST_MSG_PREVIEW),
+            )
             for item in messages:
-                node = item.get("node", {})
-                sender = (node.get("sender") or {}).get("fullName", "")
-                text = str(node.get("text", ""))
-                rows_local.append(
-                    [
-                        str(node.get("id", "")),
-                        str(node.get("created", "")),
-                        str(sender),
-                        "yes" if node.get("read") else "no",
-                        str(thread.get("type", "")),
-                        str(thread.get("modified", "")),
-                        ", ".join(r.get("fullName", "") for r in (thread.get("recipients") or [])),
-                        _truncate(str(thread.get("lastMessage", "")), LAST_MSG_PREVIEW),
-                        _truncate(text, TEXT_PREVIEW),
-                    ]
-                )
-            return rows_local
+                node = item.get("node") or EMPTY
+                yield [
+                    _cell(node.get("id")),
+                    _cell(node.get("created")),
+                    _cell((node.get("sender") or EMPTY).get("fullName")),
+                    YES_NO[bool(node.get("read"))],
+                    *thread_cells,
+                    _truncate(_cell(node.get("text")), TEXT_PREVIEW),
+                ]
 
         run_query_table(
             query=queries.CHAT_MESSAGES,
@@ -160,19 +212,11 @@ def register_chat(app: typer.Typer) -> None:  # noqa: PLR0915
             label="thread",
             json_output=json_output,
             empty_msg="No messages.",
-            headers=[
-                "ID",
-                "Created",
-                "Sender",
-                "Read",
-                "Type",
-                "Modified",
-                "Recipients",
-                "Last message",
-                "Text",
-            ],
-            title=lambda payload: f"💬 Messages in {(payload.get('thread') or {}).get('name','')}",
+            headers=_MESSAGE_HEADERS,
+            title=_message_title,
             rows_fn=_rows,
+            pages=pages,
+            nested="messages",
         )
 
     @app.command("chat-users")
@@ -180,26 +224,12 @@ def register_chat(app: typer.Typer) -> None:  # noqa: PLR0915
         user_types: str = typer.Option(
             "", "--type", help="Comma-separated user types; empty for all."
         ),
-        json_output: bool = typer.Option(False, "--json/--no-json"),
+        json_output: bool = JSON_OPTION,
     ) -> None:
         """Fetch users available for chat."""
-        types_list = [u for u in user_types.split(",") if u] if user_types else []
+        types_list = split_csv(user_types)
         variables = {"userTypes": types_list}
 
-        def _rows(payload: dict[str, Any]) -> list[list[str]]:
-            users = payload.get("usersForChat") or []
-            rows_local: list[list[str]] = []
-            for user in users:
-                rows_local.append(
-                    [
-                        str(user.get("chatDisplayName", "")),
-                        str(user.get("userType", "")),
-                        str(user.get("chatUserPosition", "")),
-                        str(user.get("roleName", "")),
-                    ]
-                )
-            return rows_local
-
         run_query_table(
             query=queries.USERS_FOR_CHAT,
             variables=variables,
@@ -208,35 +238,17 @@ def register_chat(app: typer.Typer) -> None:  # noqa: PLR0915
             empty_msg="No chat users.",
             headers=["Name", "Type", "Position", "Role"],
             title="💬 Chat users",
-            rows_fn=_rows,
+            rows_fn=_chat_user_rows,
         )
 
     @app.command("chat-search")
     def chat_search(
         search: str = typer.Option("", "--search", help="Search phrase for groupsForChat."),
-        json_output: bool = typer.Option(False, "--json/--no-json"),
+        json_output: bool = JSON_OPTION,
     ) -> None:
         """Search chat groups and parents (groupsForChat)."""
         variables = {"search": search}
 
-        def _rows(payload: dict[str, Any]) -> list[list[str]]:
-            groups = payload.get("groupsForChat") or []
-            rows_local: list[list[str]] = []
-            for group in groups:
-                children = group.get("children") or []
-                parents = []
-                for child in children:
-                    for parent in child.get("parents") or []:
-                        parents.append(parent.get("chatDisplayName", ""))
-                rows_local.append(
-                    [
-                        str(group.get("id", "")),
-                        str(group.get("name", "")),
-                        ", ".join(parents),
-                    ]
-                )
-            return rows_local
-
         run_query_table(
             query=queries.GROUPS_FOR_CHAT,
             variables=variables,
@@ -245,7 +257,7 @@ def register_chat(app: typer.Typer) -> None:  # noqa: PLR0915
             empty_msg="No chat groups.",
             headers=["ID", "Name", "Parents"],
             title="💬 Chat search",
-            rows_fn=_rows,
+            rows_fn=_chat_group_rows,
         )
 
     @app.command("chat-send")
@@ -258,11 +270,11 @@ def register_chat(app: typer.Typer) -> None:  # noqa: PLR0915
             "--parents-visible/--parents-hidden",
             help="Parents mutual visibility flag.",
         ),
-        json_output: bool = typer.Option(False, "--json/--no-json"),
+        json_output: bool = JSON_OPTION,
     ) -> None:
         """Send a chat message (creates a thread)."""
         settings, tokens, context = _env()
-        recipient_list = [r.strip() for r in recipients.split(",") if r.strip()]
+        recipient_list = split_csv(recipients)
         variables = {
             "input": {
                 "message": {"text": text, "attachment": None},
@@ -279,9 +291,9 @@ def register_chat(app: typer.Typer) -> None:  # noqa: PLR0915
             console.print(f"[red]GraphQL error:[/red] {exc}")
             raise typer.Exit(code=1) from exc
         if json_output:
-            console.print_json(data=data)
+            print_json(data)
         else:
-            result = (data.get("createThread") or {}) if isinstance(data, dict) else {}
+            result = data.get("createThread") or EMPTY
             if result.get("success"):
                 console.print(f"[green]Thread created. id={result.get('id')}[/green]")
             else:
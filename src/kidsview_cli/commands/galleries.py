@@ -6,18 +6,54 @@ from typing import Any
 import typer
 
 from .. import queries
+from ..config import Settings
+from ..context import Context
 from ..download import download_all, fetch_galleries, make_progress
 from ..helpers import (
+    AFTER_OPTION,
+    JSON_OPTION,
     console,
+    field_cells,
+    print_json,
     run_query_table,
+    split_csv,
 )
 from ..helpers import env as _env
 from ..helpers import execute_graphql as _execute_graphql
 from ..helpers import fetch_me as _fetch_me
+from ..helpers import full_name as _full_name
+from ..helpers import http_client as _http_client
 from ..helpers import (
     prompt_multi_choice as _prompt_multi_choice,
 )
+from ..helpers import remember_child_name as _remember_child_name
 from ..helpers import run as _run
+from ..session import AuthTokens
+
+_GALLERY_CELLS = field_cells("id", "name", "created", "imagesCount")
+
+
+def _child_dir_name(settings: Settings, tokens: AuthTokens, context: Context) -> str | None:
+    """Child's display name for the download folder, falling back to the child ID.
+
+    The name is cached in the context file, so `me` is fetched only the first time.
+    """
+    if context.child_name:
+        return context.child_name
+    child_name: str | None = None
+    try:
+        me_data = _fetch_me(settings, tokens, context)
+        me_obj = me_data.get("me") or {}
+        for child in me_obj.get("children") or []:
+            if str(child.get("id")) == context.child_id:
+                child_name = _full_name(child) or None
+                break
+    except Exception:
+        child_name = None
+    if not child_name:
+        return context.child_id
+    _remember_child_name(settings, context, child_name)
+    return child_name
 
 
 def register_galleries(app: typer.Typer) -> None:  # noqa: PLR0915
@@ -25,10 +61,10 @@ def register_galleries(app: typer.Typer) -> None:  # noqa: PLR0915
     def galleries(  # noqa: PLR0913
         group_id: str | None = typer.Option(None, help="Group ID filter."),
         first: int = typer.Option(3, help="Items to fetch."),
-        after: str | None = typer.Option(None, help="Cursor for pagination."),
+        after: str | None = AFTER_OPTION,
         search: str = typer.Option("", help="Search phrase."),
         order: str | None = typer.Option(None, help="Order string."),
-        json_output: bool = typer.Option(False, "--json/--no-json"),
+        json_output: bool = JSON_OPTION,
     ) -> None:
         """Fetch galleries."""
         variables: dict[str, object] = {
@@ -48,12 +84,7 @@ def register_galleries(app: typer.Typer) -> None:  # noqa: PLR0915
             headers=headers,
             title="🖼️ Galleries",
             rows_fn=lambda payload: [
-                [
-                    str((item.get("node") or {}).get("id", "")),
-                    str((item.get("node") or {}).get("name", "")),
-                    str((item.get("node") or {}).get("created", "")),
-                    str((item.get("node") or {}).get("imagesCount", "")),
-                ]
+                _GALLERY_CELLS(item.get("node") or {})
                 for item in (payload.get("galleries") or {}).get("edges") or []
             ],
             show_lines=True,
@@ -76,30 +107,20 @@ def register_galleries(app: typer.Typer) -> None:  # noqa: PLR0915
         # Resolve child name for subdirectory (if context has child_id)
         child_name: str | None = None
         if context and context.child_id:
-            try:
-                me_data = _fetch_me(settings, tokens, context)
-                me_obj = me_data.get("me") or {}
-                for child in me_obj.get("children") or []:
-                    if str(child.get("id")) == context.child_id:
-                        child_name = (
-                            f"{child.get('name','')} {child.get('surname','')}".strip() or None
-                        )
-                        break
-            except Exception:
-                child_name = None
-            if not child_name:
-                child_name = context.child_id
+            child_name = _child_dir_name(settings, tokens, context)
 
         dest_base = output_dir or settings.download_dir
         dest = Path(dest_base).expanduser()
         dest.mkdir(parents=True, exist_ok=True)
 
-        id_list = [i.strip() for i in ids.split(",") if i.strip()]
+        id_list = split_csv(ids)
         galleries_cache: list[dict[str, Any]] | None = None
         if not all_ and not id_list:
             try:
                 galleries_cache = _run(
-                    fetch_galleries(settings=settings, tokens=tokens, context=context)
+                    fetch_galleries(
+                        settings=settings, tokens=tokens, context=context, http=_http_client()
+                    )
                 )
             except Exception as exc:  # pragma: no cover - network errors
                 console.print(f"[red]Failed to list galleries:[/red] {exc}")
@@ -126,6 +147,7 @@ def register_galleries(app: typer.Typer) -> None:  # noqa: PLR0915
                         progress=progress,
                         concurrency=4,
                         child_name=child_name,
+                        http=_http_client(),
                     )
                 )
         except Exception as exc:  # pragma: no cover - network/file errors
@@ -143,7 +165,7 @@ def register_galleries(app: typer.Typer) -> None:  # noqa: PLR0915
     @app.command("gallery-like")
     def gallery_like(
         gallery_id: str = typer.Option(..., "--id", help="Gallery ID to like/unlike."),
-        json_output: bool = typer.Option(False, "--json/--no-json"),
+        json_output: bool = JSON_OPTION,
     ) -> None:
         """Toggle like for a gallery."""
         settings, tokens, context = _env()
@@ -156,7 +178,7 @@ def register_galleries(app: typer.Typer) -> None:  # noqa: PLR0915
             label="setGalleryLike",
         )
         if json_output:
-            console.print_json(data=data)
+            print_json(data)
         else:
             result = (data.get("setGalleryLike") or {}).get("isLiked")
             console.print(f"[green]Gallery like toggled. isLiked={result}[/green]")
@@ -165,7 +187,7 @@ def register_galleries(app: typer.Typer) -> None:  # noqa: PLR0915
     def gallery_comment(
         gallery_id: str = typer.Option(..., "--id", help="Gallery ID."),
         content: str = typer.Option(..., "--content", prompt=True, help="Comment text."),
-        json_output: bool = typer.Option(False, "--json/--no-json"),
+        json_output: bool = JSON_OPTION,
     ) -> None:
         """Add comment to a gallery."""
         settings, tokens, context = _env()
@@ -178,7 +200,7 @@ def register_galleries(app: typer.Typer) -> None:  # noqa: PLR0915
             label="createGalleryComment",
         )
         if json_output:
-            console.print_json(data=data)
+            print_json(data)
         else:
             errors = (data.get("createGalleryComment") or {}).get("errors")
             if errors:
@@ -1,41 +1,59 @@
 # ruff: noqa: B008
 from __future__ import annotations
 
-import json
+from collections.abc import Iterator
 from typing import Any
 
+import orjson
 import typer
 
 from .. import queries
 from ..helpers import (
+    AFTER_OPTION,
+    EMPTY,
+    JSON_OPTION,
+    YES_NO,
     console,
     run_query_table,
 )
+from ..helpers import (
+    cell as _cell,
+)
 from ..helpers import (
     env as _env,
 )
 from ..helpers import (
     execute_graphql as _execute_graphql,
 )
+from ..helpers import (
+    execute_graphql_many as _execute_graphql_many,
+)
+from ..helpers import (
+    load_session as _load_session,
+)
+from ..helpers import (
+    print_json as _print_json,
+)
 from ..helpers import (
     print_table as _print_table,
 )
 from ..helpers import (
     truncate as _truncate,
 )
+from ..session import AuthTokens
 
 
 def register_notifications(app: typer.Typer) -> None:  # noqa: PLR0915
     @app.command()
-    def unread(json_output: bool = typer.Option(False, "--json/--no-json")) -> None:
+    def unread(json_output: bool = JSON_OPTION) -> None:
         """Fetch unread notification/message counts."""
         headers = ["Type", "Count"]
 
         def _rows(payload: dict[str, Any]) -> list[list[str]]:
-            counts = (payload.get("me") or {}) if payload else {}
+            counts = (payload.get("me") or EMPTY) if payload else EMPTY
             return [
-                ["Notifications", str(counts.get("unreadNotificationsCount", 0))],
-                ["Messages", str(counts.get("unreadMessagesCount", 0))],
+                ["Notifications", _cell(counts.get("unreadNotificationsCount")) or "0"],
+                ["Messages", _cell(counts.get("unreadMessagesCount")) or "0"],
             ]
 
         run_query_table(
@@ -52,7 +70,7 @@ def register_notifications(app: typer.Typer) -> None:  # noqa: PLR0915
     @app.command()
     def notifications(  # noqa: PLR0912, PLR0913, PLR0915
         first: int = typer.Option(20, help="Number of notifications to fetch."),
-        after: str | None = typer.Option(None, help="Cursor for pagination."),
+        after: str | None = AFTER_OPTION,
         pending: bool | None = typer.Option(None, help="Pending filter."),
         type_filter: str | None = typer.Option(None, "--type", help="Type filter (client-side)."),
         only_unread: bool = typer.Option(
@@ -66,25 +84,45 @@ def register_notifications(app: typer.Typer) -> None:  # noqa: PLR0915
             "--all-pages",
             help="Fetch all pages (honors type/pending filters) when marking read.",
         ),
-        json_output: bool = typer.Option(False, "--json/--no-json"),
+        json_output: bool = JSON_OPTION,
     ) -> None:
         """Fetch notifications."""
         settings, tokens, context = _env()
         variables: dict[str, object] = {"first": first, "after": after, "pending": pending}
 
+        def _current_tokens() -> AuthTokens:
+            # A refresh during an earlier page saves new tokens; later calls should use them
+            # rather than fail and refresh again.
+            return _load_session(settings.session_file) or tokens
+
         def _fetch_page(after_cursor: str | None) -> dict[str, Any]:
             page_vars = {**variables, "after": after_cursor}
             return _execute_graphql(
-                settings, tokens, queries.NOTIFICATIONS, page_vars, context, label="notifications"
+                settings,
+                _current_tokens(),
+                queries.NOTIFICATIONS,
+                page_vars,
+                context,
+                label="notifications",
             )
 
-        all_edges: list[dict[str, Any]] = []
+        type_norm = type_filter.lower() if type_filter else None
+
+        def _keep(edge: dict[str, Any]) -> bool:
+            """Client-side filters; the notifications query has no type/read arguments."""
+            node = edge.get("node") or {}
+            if type_norm and _cell(node.get("type")).lower() != type_norm:
+                return False
+            return not (only_unread and node.get("isRead"))
+
+        # Each page's cursor comes from the previous response, so pages are fetched in
+        # order; filtering as they arrive keeps only the edges we will show or mark.
+        filtered_edges: list[dict[str, Any]] = []
         next_cursor: str | None = after
         while True:
             data = _fetch_page(next_cursor)
             notifications_conn = data.get("notifications") or {}
-            edges = notifications_conn.get("edges") or []
-            all_edges.extend(edges)
+            filtered_edges.extend(filter(_keep, notifications_conn.get("edges") or []))
             page_info = notifications_conn.get("pageInfo") or {}
             if not all_pages or not page_info.get("hasNextPage"):
                 break
@@ -92,63 +130,52 @@ def register_notifications(app: typer.Typer) -> None:  # noqa: PLR0915
             if not next_cursor:
                 break
 
-        # client-side filters
-        filtered_edges = all_edges
-        if type_filter:
-            type_norm = type_filter.lower()
-            filtered_edges = [
-                e
-                for e in filtered_edges
-                if str((e.get("node") or {}).get("type", "")).lower() == type_norm
-            ]
-        if only_unread:
-            filtered_edges = [e for e in filtered_edges if not (e.get("node") or {}).get("isRead")]
-
         payload = {"notifications": {"edges": filtered_edges}}
 
         if mark_read and filtered_edges:
-            for edge in filtered_edges:
-                notif_id = (edge.get("node") or {}).get("notification", {}).get("id")
-                if notif_id:
-                    _execute_graphql(
-                        settings,
-                        tokens,
-                        queries.SET_NOTIFICATION_READ,
-                        {"notificationId": notif_id},
-                        context,
-                        label="setNotificationRead",
-                    )
+            notif_ids = [
+                notif_id
+                for edge in filtered_edges
+                if (notif_id := (edge.get("node") or {}).get("notification", {}).get("id"))
+            ]
+            _execute_graphql_many(
+                settings,
+                _current_tokens(),
+                queries.SET_NOTIFICATION_READ,
+                [{"notificationId": notif_id} for notif_id in notif_ids],
+                ctx=context,
+                label="setNotificationRead",
+            )
 
         if json_output:
-            console.print_json(data=payload)
+            _print_json(payload)
             return
 
         if not filtered_edges:
             console.print("No notifications.")
             return
 
-        rows = []
+        def _rows() -> Iterator[tuple[str, str, str, str, str]]:
+            for item in filtered_edges:
+                get = item.get("node", {}).get
+                data_field = get("data")
+                date_val = ""
+                # Only payloads that mention a date are worth parsing.
+                if isinstance(data_field, str) and '"date"' in data_field:
+                    try:
+                        date_val = str(orjson.loads(data_field).get("date", ""))
+                    except (orjson.JSONDecodeError, AttributeError):
+                        date_val = ""
+                yield (
+                    _cell(get("id")),
+                    _truncate(_cell(get("text")), 120),
+                    _cell(get("created")),
+                    _cell(get("type")),
+                    date_val,
+                )
+
         headers = ["ID", "Text", "Created", "Type", "On date"]
-        for item in filtered_edges:
-            node = item.get("node", {})
-            data_field = node.get("data")
-            date_val = ""
-            if isinstance(data_field, str):
-                try:
-                    parsed = json.loads(data_field)
-                    date_val = str(parsed.get("date", ""))
-                except Exception:
-                    date_val = ""
-        rows.append(
-            (
-                str(node.get("id", "")),
-                _truncate(str(node.get("text", "")), 120),
-                str(node.get("created", "")),
-                str(node.get("type", "")),
-                date_val,
-            )
-        )
-        _print_table("🔔 Notifications", rows, headers, show_lines=True)
+        _print_table("🔔 Notifications", _rows(), headers, show_lines=True)
 
     @app.command("notification-prefs")
     def notification_prefs(  # noqa: PLR0913
@@ -162,7 +189,7 @@ def register_notifications(app: typer.Typer) -> None:  # noqa: PLR0915
             "--disable",
             help="Disable notification types (repeatable, e.g., --disable NEW_GALLERY).",
         ),
-        json_output: bool = typer.Option(False, "--json/--no-json"),
+        json_output: bool = JSON_OPTION,
     ) -> None:
         """Show or update notification preferences."""
         settings, tokens, context = _env()
@@ -179,11 +206,11 @@ def register_notifications(app: typer.Typer) -> None:  # noqa: PLR0915
             prefs = data.get("userNotificationPreferences") or []
             return prefs if isinstance(prefs, list) else []
 
-        changes: list[dict[str, object]] = []
-        for name in enable or []:
-            changes.append({"notificationType": name.upper(), "enabled": True})
-        for name in disable or []:
-            changes.append({"notificationType": name.upper(), "enabled": False})
+        changes: list[dict[str, object]] = [
+            {"notificationType": name.upper(), "enabled": enabled}
+            for enabled, names in ((True, enable), (False, disable))
+            for name in names or ()
+        ]
 
         if changes:
             _execute_graphql(
@@ -198,13 +225,13 @@ def register_notifications(app: typer.Typer) -> None:  # noqa: PLR0915
         prefs = _list_prefs()
         payload = {"userNotificationPreferences": prefs}
         if json_output:
-            console.print_json(data=payload)
+            _print_json(payload)
         else:
             if not prefs:
                 console.print("No notification preferences.")
                 return
             rows = [
-                (str(pref.get("notificationType", "")), "yes" if pref.get("enabled") else "no")
+                (_cell(pref.get("notificationType")), YES_NO[bool(pref.get("enabled"))])
                 for pref in prefs
             ]
             _print_table("🔔 Notification preferences", rows, ["Type", "Enabled"])
@@ -1,12 +1,29 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterator, Mapping, Sequence
+from datetime import date
 from typing import Any
 
 import typer
 
 from .. import queries
-from ..helpers import run_query_table
+from ..helpers import (
+    AFTER_OPTION,
+    EMPTY,
+    JSON_OPTION,
+    YES_NO,
+    cell,
+    field_cells,
+    full_name,
+    run_query_table,
+    split_csv,
+)
+from ..helpers import normalize_date as _normalize_date
+
+_ORDER_CELLS = field_cells("id", "created", "amount", "bluemediaPaymentStatus", "bookingDate")
+_COMPONENT_CELLS = field_cells("id", "name", "type")
+_PERIOD_CELLS = field_cells("id", "month.startDate", "month.endDate")
+_PERIOD_TOTAL_CELLS = field_cells("monthlyBillsTotalAmount", "monthlyBillsTotalPaid")
 
 
 def register_payments(app: typer.Typer) -> None:  # noqa: PLR0915
@@ -18,8 +35,8 @@ def register_payments(app: typer.Typer) -> None:  # noqa: PLR0915
         type_filter: str | None = typer.Option(None, "--type", help="Payment type filter."),
         is_booked: bool | None = typer.Option(None, "--booked/--not-booked", help="Booked flag."),
         first: int = typer.Option(20, help="Number of records."),
-        after: str | None = typer.Option(None, help="Cursor for pagination."),
-        json_output: bool = typer.Option(False, "--json/--no-json"),
+        after: str | None = AFTER_OPTION,
+        json_output: bool = JSON_OPTION,
     ) -> None:
         """Fetch payments history."""
         variables: dict[str, object] = {
@@ -33,24 +50,20 @@ def register_payments(app: typer.Typer) -> None:  # noqa: PLR0915
         }
         headers = ["Title", "Amount", "Date", "Type", "Booked", "Child"]
 
-        def _rows(payload: dict[str, Any]) -> list[Sequence[str]]:
+        def _rows(payload: dict[str, Any]) -> Iterator[Sequence[str]]:
             edges = (payload.get("payments") or {}).get("edges") or []
-            rows_local: list[Sequence[str]] = []
             for item in edges:
-                node = item.get("node", {})
-                child = node.get("child") or {}
-                child_name = f"{child.get('name','')} {child.get('surname','')}".strip()
-                rows_local.append(
-                    (
-                        str(node.get("title", "")),
-                        str(node.get("amount", "")),
-                        str(node.get("paymentDate", "")),
-                        str(node.get("type", "")),
-                        "yes" if node.get("isBooked") else "no",
-                        child_name or "-",
-                    )
+                node = item.get("node") or EMPTY
+                child = node.get("child") or EMPTY
+                child_name = full_name(child)
+                yield (
+                    cell(node.get("title")),
+                    cell(node.get("amount")),
+                    cell(node.get("paymentDate")),
+                    cell(node.get("type")),
+                    YES_NO[bool(node.get("isBooked"))],
+                    child_name or "-",
                 )
-            return rows_local
 
         run_query_table(
             query=queries.PAYMENTS,
@@ -73,12 +86,12 @@ def register_payments(app: typer.Typer) -> None:  # noqa: PLR0915
         paid_count_lte: int | None = typer.Option(None, help="Max paid monthly bills count."),
         children_first: int = typer.Option(50, help="Number of children to fetch."),
         children_after: str | None = typer.Option(None, help="Cursor for children pagination."),
-        json_output: bool = typer.Option(False, "--json/--no-json"),
+        json_output: bool = JSON_OPTION,
     ) -> None:
         """Fetch payments summary (balances per child)."""
         variables: dict[str, object] = {
             "search": search or None,
-            "groupsIds": [g for g in groups_ids.split(",") if g] or None,
+            "groupsIds": split_csv(groups_ids) or None,
             "balanceGte": balance_gte,
             "balanceLte": balance_lte,
             "paidMonthlyBillsCountGte": paid_count_gte,
@@ -87,24 +100,20 @@ def register_payments(app: typer.Typer) -> None:  # noqa: PLR0915
             "childrenAfter": children_after,
         }
 
-        def _rows(payload: dict[str, Any]) -> list[Sequence[str]]:
+        def _rows(payload: dict[str, Any]) -> Iterator[Sequence[str]]:
             summary = payload.get("paymentsSummary") or {}
             children_conn = summary.get("children") or {}
             edges = children_conn.get("edges") or []
-            rows_local: list[Sequence[str]] = []
             for item in edges:
-                node = item.get("node", {}) or {}
-                child_name = f"{node.get('name','')} {node.get('surname','')}".strip()
-                rows_local.append(
-                    (
-                        child_name or "-",
-                        str(node.get("amount", "")),
-                        str(node.get("paidAmount", "")),
-                        str(node.get("balance", "")),
-                        str(node.get("paidMonthlyBillsCount", "")),
-                    )
+                node = item.get("node") or EMPTY
+                child_name = full_name(node)
+                yield (
+                    child_name or "-",
+                    cell(node.get("amount")),
+                    cell(node.get("paidAmount")),
+                    cell(node.get("balance")),
+                    cell(node.get("paidMonthlyBillsCount")),
                 )
-            return rows_local
 
         def _title(payload: dict[str, Any]) -> str:
             summary = payload.get("paymentsSummary") or {}
@@ -128,9 +137,13 @@ def register_payments(app: typer.Typer) -> None:  # noqa: PLR0915
         before: str | None = typer.Option(None, help="Cursor before."),
         offset: int | None = typer.Option(None, help="Offset for pagination."),
         status: str | None = typer.Option(None, help="Filter by payment status (client-side)."),
-        created_from: str | None = typer.Option(None, help="Filter created >= (YYYY-MM-DD)."),
-        created_to: str | None = typer.Option(None, help="Filter created <= (YYYY-MM-DD)."),
-        json_output: bool = typer.Option(False, "--json/--no-json"),
+        created_from: str | None = typer.Option(
+            None, help="Filter created >= (YYYY-MM-DD or 'today'/'tomorrow'/'yesterday')."
+        ),
+        created_to: str | None = typer.Option(
+            None, help="Filter created <= (YYYY-MM-DD or 'today'/'tomorrow'/'yesterday')."
+        ),
+        json_output: bool = JSON_OPTION,
     ) -> None:
         """Fetch payment orders."""
         variables: dict[str, object] = {
@@ -139,46 +152,24 @@ def register_payments(app: typer.Typer) -> None:  # noqa: PLR0915
             "before": before,
             "offset": offset,
         }
+        # Loop invariants for the filters below: resolved once, not per edge.
+        today = date.today()
+        created_min = _normalize_date(created_from, today) if created_from else None
+        created_max = _normalize_date(created_to, today) if created_to else None
+        status_l = status.lower() if status else None
 
-        def _rows(payload: dict[str, Any]) -> list[Sequence[str]]:
-            orders = payload.get("paymentOrders") or {}
-            edges = orders.get("edges") or []
-            filtered = edges
-            status_l = status.lower() if status else None
-            if status_l:
-                filtered = [
-                    e
-                    for e in filtered
-                    if str((e.get("node") or {}).get("bluemediaPaymentStatus", "")).lower()
-                    == status_l
-                ]
-            if created_from:
-                filtered = [
-                    e
-                    for e in filtered
-                    if str((e.get("node") or {}).get("created", "")) >= created_from
-                ]
-            if created_to:
-                filtered = [
-                    e
-                    for e in filtered
-                    if str((e.get("node") or {}).get("created", "")) <= created_to
-                ]
+        def _keep(node: Mapping[str, Any]) -> bool:
+            """All client-side filters in one pass over the page."""
+            created = cell(node.get("created"))
+            return (
+                (not status_l or cell(node.get("bluemediaPaymentStatus")).lower() == status_l)
+                and (not created_min or created >= created_min)
+                and (not created_max or created <= created_max)
+            )
 
-            rows_local: list[Sequence[str]] = []
-            for item in filtered:
-                node = item.get("node", {}) or {}
-                rows_local.append(
-                    (
-                        str(node.get("id", "")),
-                        str(node.get("created", "")),
-                        str(node.get("amount", "")),
-                        str(node.get("bluemediaPaymentStatus", "")),
-                        str(node.get("bookingDate", "")),
-                    )
-                )
-            payload["paymentOrders"] = {**orders, "edges": filtered}
-            return rows_local
+        def _rows(payload: dict[str, Any]) -> Iterator[Sequence[str]]:
+            edges = (payload.get("paymentOrders") or {}).get("edges") or []
+            return map(_ORDER_CELLS, filter(_keep, (e.get("node") or EMPTY for e in edges)))
 
         run_query_table(
             query=queries.PAYMENT_ORDERS,
@@ -194,8 +185,8 @@ def register_payments(app: typer.Typer) -> None:  # noqa: PLR0915
     @app.command("payment-components")
     def payment_components(
         first: int = typer.Option(20, help="Number of components."),
-        after: str | None = typer.Option(None, help="Cursor for pagination."),
-        json_output: bool = typer.Option(False, "--json/--no-json"),
+        after: str | None = AFTER_OPTION,
+        json_output: bool = JSON_OPTION,
     ) -> None:
         """List payment components."""
         variables = {"first": first, "after": after}
@@ -208,11 +199,7 @@ def register_payments(app: typer.Typer) -> None:  # noqa: PLR0915
             headers=["ID", "Name", "Type"],
             title="💸 Payment components",
             rows_fn=lambda payload: [
-                (
-                    str((edge.get("node") or {}).get("id", "")),
-                    str((edge.get("node") or {}).get("name", "")),
-                    str((edge.get("node") or {}).get("type", "")),
-                )
+                _COMPONENT_CELLS(edge.get("node") or EMPTY)
                 for edge in (payload.get("paymentComponents") or {}).get("edges") or []
             ],
         )
@@ -220,8 +207,8 @@ def register_payments(app: typer.Typer) -> None:  # noqa: PLR0915
     @app.command("billing-periods")
     def billing_periods(
         first: int = typer.Option(20, help="Number of periods."),
-        after: str | None = typer.Option(None, help="Cursor for pagination."),
-        json_output: bool = typer.Option(False, "--json/--no-json"),
+        after: str | None = AFTER_OPTION,
+        json_output: bool = JSON_OPTION,
     ) -> None:
         """List billing periods."""
         variables = {"first": first, "after": after}
@@ -234,21 +221,19 @@ def register_payments(app: typer.Typer) -> None:  # noqa: PLR0915
             headers=["ID", "Start", "End", "Closed"],
             title="🧾 Billing periods",
             rows_fn=lambda payload: [
-                (
-                    str((edge.get("node") or {}).get("id", "")),
-                    str(((edge.get("node") or {}).get("month") or {}).get("startDate", "")),
-                    str(((edge.get("node") or {}).get("month") or {}).get("endDate", "")),
-                    "yes" if (edge.get("node") or {}).get("isClosed") else "no",
+                (*_PERIOD_CELLS(node), YES_NO[bool(node.get("isClosed"))])
+                for node in (
+                    edge.get("node") or EMPTY
+                    for edge in (payload.get("billingPeriods") or {}).get("edges") or []
                 )
-                for edge in (payload.get("billingPeriods") or {}).get("edges") or []
             ],
         )
 
     @app.command("employee-billing-periods")
     def employee_billing_periods(
         first: int = typer.Option(20, help="Number of periods."),
-        after: str | None = typer.Option(None, help="Cursor for pagination."),
-        json_output: bool = typer.Option(False, "--json/--no-json"),
+        after: str | None = AFTER_OPTION,
+        json_output: bool = JSON_OPTION,
     ) -> None:
         """List billing periods for employees (if permitted)."""
         variables = {"first": first, "after": after}
@@ -262,22 +247,22 @@ def register_payments(app: typer.Typer) -> None:  # noqa: PLR0915
             title="🧾 Employee billing periods",
             rows_fn=lambda payload: [
                 (
-                    str((edge.get("node") or {}).get("id", "")),
-                    str(((edge.get("node") or {}).get("month") or {}).get("startDate", "")),
-                    str(((edge.get("node") or {}).get("month") or {}).get("endDate", "")),
-                    "yes" if (edge.get("node") or {}).get("isClosed") else "no",
-                    str((edge.get("node") or {}).get("monthlyBillsTotalAmount", "")),
-                    str((edge.get("node") or {}).get("monthlyBillsTotalPaid", "")),
+                    *_PERIOD_CELLS(node),
+                    YES_NO[bool(node.get("isClosed"))],
+                    *_PERIOD_TOTAL_CELLS(node),
+                )
+                for node in (
+                    edge.get("node") or EMPTY
+                    for edge in (payload.get("employeeBillingPeriods") or {}).get("edges") or []
                 )
-                for edge in (payload.get("employeeBillingPeriods") or {}).get("edges") or []
             ],
         )
 
     @app.command("tuition-discounts")
     def tuition_discounts(
         first: int = typer.Option(20, help="Number of discounts."),
-        after: str | None = typer.Option(None, help="Cursor for pagination."),
-        json_output: bool = typer.Option(False, "--json/--no-json"),
+        after: str | None = AFTER_OPTION,
+        json_output: bool = JSON_OPTION,
     ) -> None:
         """List tuition discounts (if available)."""
         variables = {"first": first, "after": after}
@@ -291,11 +276,11 @@ def register_payments(app: typer.Typer) -> None:  # noqa: PLR0915
             title="🏷 Tuition discounts",
             rows_fn=lambda payload: [
                 (
-                    str(d.get("id", "")),
-                    str(d.get("name", "")),
-                    str(d.get("value", "")),
-                    str(d.get("valueType", "")) if "valueType" in d else str(d.get("type", "")),
-                    "yes" if d.get("active") else "no",
+                    cell(d.get("id")),
+                    cell(d.get("name")),
+                    cell(d.get("value")),
+                    cell(d.get("valueType")) if "valueType" in d else cell(d.get("type")),
+                    YES_NO[bool(d.get("active"))],
                 )
                 for d in (payload.get("tuitionDiscounts") or [])
             ],
@@ -303,7 +288,7 @@ def register_payments(app: typer.Typer) -> None:  # noqa: PLR0915
 
     @app.command("employee-roles")
     def employee_roles(
-        json_output: bool = typer.Option(False, "--json/--no-json"),
+        json_output: bool = JSON_OPTION,
     ) -> None:
         """List employee roles (if permitted)."""
         run_query_table(
@@ -316,9 +301,9 @@ def register_payments(app: typer.Typer) -> None:  # noqa: PLR0915
             title="👥 Employee roles",
             rows_fn=lambda payload: [
                 (
-                    str(role.get("id", "")),
-                    str(role.get("name", "")),
-                    ", ".join(role.get("permissions", []) or []),
+                    cell(role.get("id")),
+                    cell(role.get("name")),
+                    ", ".join(map(cell, role.get("permissions") or ())),
                 )
                 for role in payload.get("employeeRoles") or []
             ],
@@ -329,27 +314,23 @@ def register_payments(app: typer.Typer) -> None:  # noqa: PLR0915
         first: int = typer.Option(20, help="Number of employees."),
         after: str | None = typer.Option(None, help="Cursor after."),
         search: str = typer.Option("", help="Search phrase."),
-        json_output: bool = typer.Option(False, "--json/--no-json"),
+        json_output: bool = JSON_OPTION,
     ) -> None:
         """List employees (basic fields)."""
         variables = {"first": first, "after": after, "search": search or None}
 
-        def _rows(payload: dict[str, Any]) -> list[Sequence[str]]:
+        def _rows(payload: dict[str, Any]) -> Iterator[Sequence[str]]:
             edges = (payload.get("employees") or {}).get("edges") or []
-            rows_local: list[Sequence[str]] = []
             for edge in edges:
-                node = edge.get("node") or {}
-                rows_local.append(
-                    (
-                        str(node.get("id", "")),
-                        f"{node.get('firstName','')} {node.get('lastName','')}".strip(),
-                        str(node.get("email", "")),
-                        str(node.get("phone", "")),
-                        str(node.get("position", "")),
-                        str((node.get("role") or {}).get("name", "")),
-                    )
+                node = edge.get("node") or EMPTY
+                yield (
+                    cell(node.get("id")),
+                    full_name(node, "firstName", "lastName"),
+                    cell(node.get("email")),
+                    cell(node.get("phone")),
+                    cell(node.get("position")),
+                    cell((node.get("role") or EMPTY).get("name")),
                 )
-            return rows_local
 
         run_query_table(
             query=queries.EMPLOYEES,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import Field
@@ -49,6 +50,16 @@ class Settings(BaseSettings):  # type: ignore[misc]
         "(KHTML, like Gecko) Version/26.0 Safari/605.1.15",
         description="User-Agent header sent to Kidsview backend.",
     )
+    persisted_queries: bool = Field(
+        default=False,
+        description="Send APQ query hashes instead of full query documents after the first "
+        "request (set via KIDSVIEW_PERSISTED_QUERIES=1; the server must support APQ).",
+    )
+    cache_ttl: float = Field(
+        default=0,
+        description="Seconds to reuse read-only query responses from the on-disk cache "
+        "(set via KIDSVIEW_CACHE_TTL; 0 disables caching).",
+    )
     config_dir: Path = Field(
         default=Path.home() / ".config" / "kidsview-cli",
         description="Config directory for CLI artifacts.",
@@ -61,9 +72,19 @@ class Settings(BaseSettings):  # type: ignore[misc]
         default=Path.home() / ".config" / "kidsview-cli" / "context.json",
         description="Selected preschool/child/year context.",
     )
+    cache_file: Path = Field(
+        default=Path.home() / ".config" / "kidsview-cli" / "cache.sqlite",
+        description="SQLite file for cached query responses (see cache_ttl).",
+    )
     download_dir: Path = Field(
         default=Path.home() / "Pictures" / "Kidsview",
         description="Default directory for gallery downloads.",
     )
 
     model_config = SettingsConfigDict(env_prefix="KIDSVIEW_", env_file=".env", extra="ignore")
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return process-wide settings (environment and .env are parsed once)."""
+    return Settings()
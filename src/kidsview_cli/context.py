@@ -11,6 +11,8 @@ class Context(BaseModel):
     preschool_id: str | None = None
     year_id: str | None = None
     locale: str = "pl"
+    # Display name of child_id, cached for gallery folders; not sent as a cookie.
+    child_name: str | None = None
 
     def cookies(self) -> dict[str, str]:
         parts: dict[str, str] = {}
@@ -2,19 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import re
-from collections.abc import Iterable
+from collections.abc import AsyncGenerator, Iterable
+from contextlib import aclosing
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
-from rich.progress import (
-    BarColumn,
-    Progress,
-    TaskID,
-    TaskProgressColumn,
-    TextColumn,
-    TimeRemainingColumn,
-)
 
 from .client import GraphQLClient
 from .config import Settings
@@ -22,6 +15,11 @@ from .context import Context
 from .queries import GALLERIES
 from .session import AuthTokens
 
+if TYPE_CHECKING:
+    from rich.progress import Progress, TaskID
+
+IMAGE_TIMEOUT = 30.0
+
 
 def sanitize_name(name: str) -> str:
     name = name.strip()
@@ -35,22 +33,65 @@ def target_dir(base: Path, name: str, gallery_id: str) -> Path:
 
 
 async def fetch_galleries(
-    settings: Settings, tokens: AuthTokens, context: Context | None, first: int = 100
+    settings: Settings,
+    tokens: AuthTokens,
+    context: Context | None,
+    first: int = 100,
+    http: httpx.AsyncClient | None = None,
 ) -> list[dict[str, Any]]:
-    client = GraphQLClient(settings, tokens, context=context)
-    data = await client.execute(GALLERIES, {"first": first})
+    async with GraphQLClient(settings, tokens, context=context, http=http) as client:
+        data = await client.execute(GALLERIES, {"first": first})
     galleries = data.get("galleries") or {}
     edges = galleries.get("edges") or []
     return [edge.get("node", {}) for edge in edges if isinstance(edge, dict)]
 
 
-async def download_gallery(
+async def stream_galleries(
+    settings: Settings,
+    tokens: AuthTokens,
+    context: Context | None,
+    page_size: int = 100,
+    http: httpx.AsyncClient | None = None,
+) -> AsyncGenerator[dict[str, Any], None]:
+    """Yield gallery nodes page by page, following the end cursor."""
+    after: str | None = None
+    async with GraphQLClient(settings, tokens, context=context, http=http) as client:
+        while True:
+            data = await client.execute(GALLERIES, {"first": page_size, "after": after})
+            galleries = data.get("galleries") or {}
+            for edge in galleries.get("edges") or []:
+                if isinstance(edge, dict):
+                    yield edge.get("node", {})
+            page_info = galleries.get("pageInfo") or {}
+            after = page_info.get("endCursor")
+            if not page_info.get("hasNextPage") or not after:
+                return
+
+
+async def _iter_galleries(
+    galleries: Iterable[dict[str, Any]],
+) -> AsyncGenerator[dict[str, Any], None]:
+    for gallery in galleries:
+        yield gallery
+
+
+async def _cancel_pending(tasks: Iterable[asyncio.Task[Any]]) -> None:
+    """Cancel unfinished tasks and wait for all of them, so none outlive a failure."""
+    for task in tasks:
+        task.cancel()
+    # Also retrieves exceptions of tasks that failed after the first error.
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def download_gallery(  # noqa: PLR0913
     gallery: dict[str, Any],
     output_dir: Path,
     *,
     child_name: str | None = None,
     progress: Progress | None = None,
     concurrency: int = 4,
+    http: httpx.AsyncClient | None = None,
+    sem: asyncio.Semaphore | None = None,
 ) -> Path:
     gid = str(gallery.get("id"))
     name = str(gallery.get("name", gid))
@@ -79,17 +120,29 @@ async def download_gallery(
                 progress.advance(task_id)
             return
         async with sem:
-            resp = await client.get(url)
+            resp = await client.get(url, timeout=IMAGE_TIMEOUT)
             resp.raise_for_status()
             filename.write_bytes(resp.content)
         if progress and task_id is not None:
             progress.advance(task_id)
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        sem = asyncio.Semaphore(concurrency)
-        await asyncio.gather(
-            *(fetch_one(idx, url, client, sem) for idx, url in enumerate(image_urls, start=1))
-        )
+    sem = sem or asyncio.Semaphore(concurrency)
+
+    async def fetch_all(client: httpx.AsyncClient) -> None:
+        tasks = [
+            asyncio.create_task(fetch_one(idx, url, client, sem))
+            for idx, url in enumerate(image_urls, start=1)
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            await _cancel_pending(tasks)
+
+    if http is not None:
+        await fetch_all(http)
+    else:
+        async with httpx.AsyncClient(timeout=IMAGE_TIMEOUT) as client:
+            await fetch_all(client)
     if progress and task_id is not None:
         progress.update(task_id, completed=len(image_urls))
     return target
@@ -106,32 +159,64 @@ async def download_all(  # noqa: PLR0913
     progress: Progress | None = None,
     concurrency: int = 4,
     child_name: str | None = None,
+    http: httpx.AsyncClient | None = None,
 ) -> list[Path]:
-    all_galleries = galleries or await fetch_galleries(settings, tokens, context)
-    if gallery_ids:
-        wanted = set(gallery_ids)
-        all_galleries = [g for g in all_galleries if str(g.get("id")) in wanted]
-
-    downloaded: list[Path] = []
-    for gal in all_galleries:
-        gid = str(gal.get("id"))
-        name = str(gal.get("name", gid))
-        base_dir = output_dir / sanitize_name(child_name) if child_name else output_dir
-        dest_dir = target_dir(base_dir, name, gid)
-        if skip_downloaded and dest_dir.exists():
-            continue
-        dest = await download_gallery(
-            gal,
-            output_dir,
-            child_name=child_name,
-            progress=progress,
-            concurrency=concurrency,
-        )
-        downloaded.append(dest)
-    return downloaded
+    """Download galleries; pass `http` to share one connection pool for API and images.
+
+    Without a prefetched `galleries` list the listing is streamed page by page, and each
+    gallery starts downloading as soon as its page arrives. One semaphore bounds image
+    fetches across all galleries.
+    """
+    remaining = set(gallery_ids) or None
+    source = (
+        _iter_galleries(galleries)
+        if galleries
+        else stream_galleries(settings, tokens, context, http=http)
+    )
+    sem = asyncio.Semaphore(concurrency)
+    base_dir = output_dir / sanitize_name(child_name) if child_name else output_dir
+    tasks: list[asyncio.Task[Path]] = []
+    try:
+        async with aclosing(source) as stream:
+            async for gal in stream:
+                gid = str(gal.get("id"))
+                if remaining is not None:
+                    if gid not in remaining:
+                        continue
+                    remaining.discard(gid)
+                name = str(gal.get("name", gid))
+                if not (skip_downloaded and target_dir(base_dir, name, gid).exists()):
+                    tasks.append(
+                        asyncio.create_task(
+                            download_gallery(
+                                gal,
+                                output_dir,
+                                child_name=child_name,
+                                progress=progress,
+                                concurrency=concurrency,
+                                http=http,
+                                sem=sem,
+                            )
+                        )
+                    )
+                if remaining is not None and len(remaining) == 0:
+                    break
+        return list(await asyncio.gather(*tasks))
+    finally:
+        # After a failed gallery or listing page, don't leave the others pending on the loop.
+        await _cancel_pending(tasks)
 
 
 def make_progress() -> Progress:
+    # rich.progress is only needed once a download starts; keep it off the CLI import path.
+    from rich.progress import (  # noqa: PLC0415
+        BarColumn,
+        Progress,
+        TaskProgressColumn,
+        TextColumn,
+        TimeRemainingColumn,
+    )
+
     return Progress(
         TextColumn("{task.description}"),
         BarColumn(),
@@ -1,26 +1,96 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine, Sequence
+import atexit
+import re
+import sys
+from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 from datetime import date, timedelta
-from typing import Any
-
+from functools import lru_cache
+from itertools import chain, islice
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, cast
+
+import httpx
+import orjson
 import typer
 from rich.console import Console
-from rich.table import Table
 
 from . import queries
 from .auth import AuthClient, AuthError
-from .client import ApiError, GraphQLClient
-from .config import Settings
+from .cache import ResponseCache, cache_key
+from .client import ApiError, GraphQLClient, new_http_client
+from .config import Settings, get_settings
 from .context import Context, ContextStore
 from .session import AuthTokens, SessionStore
 
 console = Console()
 
+# Table cell for a boolean flag, indexed by the flag: YES_NO[bool(value)].
+YES_NO = ("no", "yes")
+# Shared read-only fallback for missing nested objects in per-row lookups (`or EMPTY`).
+EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Options repeated across commands; one OptionInfo each, shared by every command using it.
+JSON_OPTION = typer.Option(False, "--json/--no-json")
+AFTER_OPTION = typer.Option(None, help="Cursor for pagination.")
+PAGES_OPTION = typer.Option(1, min=1, help="Follow the end cursor for up to this many pages.")
+
+# Rows per rendered table. Rich lays out a table only after measuring every cell, so long
+# listings are printed as consecutive tables instead of one table held in memory.
+TABLE_CHUNK_ROWS = 200
+
+# First word of a GraphQL document once leading whitespace, commas and comments are skipped.
+_OPERATION_KEYWORD = re.compile(r"(?:[\s,]|#[^\n]*)*(\w*)")
+
+# Upper bound on in-flight requests when a command fans out over many IDs.
+MAX_CONCURRENT_REQUESTS = 8
+
+_LOOP: asyncio.AbstractEventLoop | None = None
+_HTTP: httpx.AsyncClient | None = None
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """uvloop when installed (the `fast` extra), the stdlib loop otherwise."""
+    try:
+        import uvloop  # noqa: PLC0415
+    except ImportError:
+        return asyncio.new_event_loop()
+    loop: asyncio.AbstractEventLoop = uvloop.new_event_loop()
+    return loop
+
 
 def run(coro: Coroutine[Any, Any, Any]) -> Any:
-    return asyncio.run(coro)
+    """Run a coroutine on the process-wide event loop (kept open between calls)."""
+    global _LOOP  # noqa: PLW0603
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = _new_event_loop()
+    return _LOOP.run_until_complete(coro)
+
+
+def http_client() -> httpx.AsyncClient:
+    """Shared HTTP client so sequential GraphQL calls reuse the same connection."""
+    global _HTTP  # noqa: PLW0603
+    if _HTTP is None or _HTTP.is_closed:
+        _HTTP = new_http_client()
+    return _HTTP
+
+
+@atexit.register
+def _shutdown() -> None:
+    global _HTTP  # noqa: PLW0603
+    if _LOOP is None or _LOOP.is_closed():
+        return
+    if _HTTP is not None and not _HTTP.is_closed:
+        _LOOP.run_until_complete(_HTTP.aclose())
+    _HTTP = None
+    _LOOP.close()
+
+
+def cell(value: Any) -> str:
+    """Format a scalar for a table cell: strings pass through, null becomes empty."""
+    return value if type(value) is str else "" if value is None else str(value)
 
 
 def truncate(text: str, max_len: int) -> str:
@@ -29,15 +99,90 @@ def truncate(text: str, max_len: int) -> str:
     return text[: max_len - 3] + "..."
 
 
-def normalize_date(value: str) -> str:
+def full_name(person: Mapping[str, Any], first: str = "name", last: str = "surname") -> str:
+    """Join a person's first and last name, skipping missing or null parts."""
+    return " ".join(filter(None, (person.get(first), person.get(last))))
+
+
+_CSV_ITEM = re.compile(r"[^,\s]+")
+
+
+def split_csv(value: str | None) -> list[str]:
+    """Split comma- or whitespace-separated IDs, dropping blanks."""
+    return _CSV_ITEM.findall(value) if value else []
+
+
+def field_cells(*paths: str) -> Callable[[Mapping[str, Any]], tuple[str, ...]]:
+    """Build a row extractor from dotted field paths (e.g. "month.startDate").
+
+    Paths are split once; missing or null parents read as empty, and each value is
+    formatted with `cell` like the hand-written row builders.
+    """
+    # Split keys are new str objects; intern them so they share identity with the literals.
+    split_paths = [[sys.intern(key) for key in path.split(".")] for path in paths]
+
+    if all(len(path) == 1 for path in split_paths):
+        # Flat rows (the common case) are specialised to C-level map calls, no Python loop.
+        leaves = [path[0] for path in split_paths]
+
+        def _flat_cells(node: Mapping[str, Any]) -> tuple[str, ...]:
+            return tuple(map(cell, map(node.get, leaves)))
+
+        return _flat_cells
+
+    def _cells(node: Mapping[str, Any]) -> tuple[str, ...]:
+        cells = []
+        for *parents, leaf in split_paths:
+            obj = node
+            for key in parents:
+                obj = obj.get(key) or EMPTY
+            cells.append(cell(obj.get(leaf)))
+        return tuple(cells)
+
+    return _cells
+
+
+_RELATIVE_DAYS = {"today": 0, "tomorrow": 1, "yesterday": -1}
+
+
+def normalize_date(value: str, today: date | None = None) -> str:
+    """Resolve today/tomorrow/yesterday to an ISO date; pass `today` to reuse one clock read."""
     value = value.strip().lower()
-    if value == "today":
-        return date.today().isoformat()
-    if value == "tomorrow":
-        return (date.today() + timedelta(days=1)).isoformat()
-    if value == "yesterday":
-        return (date.today() - timedelta(days=1)).isoformat()
-    return value
+    offset = _RELATIVE_DAYS.get(value)
+    if offset is None:
+        return value
+    return ((today or date.today()) + timedelta(days=offset)).isoformat()
+
+
+def print_json(data: Any) -> None:
+    """Write data as JSON straight to stdout (orjson, no Rich re-encoding).
+
+    Indented for a terminal; compact when piped, where a tool like jq does the formatting.
+    """
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    out.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if console.is_terminal else None))
+    out.write(b"\n")
+    out.flush()
+
+
+def _print_options(title: str, rows: Sequence[Sequence[str]], headers: Sequence[str]) -> None:
+    """Show numbered options: a table on a terminal, plain lines when output is piped."""
+    if not console.is_terminal:
+        console.out(title)
+        for idx, row in enumerate(rows, start=1):
+            console.out(f"{idx}. " + " | ".join(row))
+        return
+
+    from rich.table import Table  # noqa: PLC0415
+
+    table = Table(title=title)
+    table.add_column("#", justify="right")
+    for h in headers:
+        table.add_column(h)
+    for idx, row in enumerate(rows, start=1):
+        table.add_row(str(idx), *row)
+    console.print(table)
 
 
 def prompt_choice(options: list[dict[str, Any]], title: str, label_key: str) -> str | None:
@@ -47,12 +192,7 @@ def prompt_choice(options: list[dict[str, Any]], title: str, label_key: str) ->
     if len(options) == 1:
         return str(options[0].get("id"))
 
-    table = Table(title=title)
-    table.add_column("#", justify="right")
-    table.add_column("Name")
-    for idx, item in enumerate(options, start=1):
-        table.add_row(str(idx), str(item.get(label_key, "")))
-    console.print(table)
+    _print_options(title, [(str(item.get(label_key, "")),) for item in options], ["Name"])
     choice = typer.prompt(f"Choose a number 1-{len(options)}", type=int)
     if 1 <= choice <= len(options):
         return str(options[choice - 1].get("id"))
@@ -65,19 +205,11 @@ def prompt_multi_choice(options: list[dict[str, Any]], title: str, label_key: st
     if not options:
         return []
 
-    table = Table(title=title)
-    table.add_column("#", justify="right")
-    table.add_column("Name")
-    table.add_column("ID")
-    for idx, item in enumerate(options, start=1):
-        table.add_row(str(idx), str(item.get(label_key, "")), str(item.get("id", "")))
-    console.print(table)
+    rows = [(str(item.get(label_key, "")), cell(item.get("id"))) for item in options]
+    _print_options(title, rows, ["Name", "ID"])
     raw = typer.prompt(f"Choose numbers (comma-separated) 1-{len(options)}", type=str)
     picks: list[str] = []
-    for raw_part in raw.split(","):
-        part = raw_part.strip()
-        if not part:
-            continue
+    for part in split_csv(raw):
         try:
             num = int(part)
         except ValueError as err:
@@ -92,14 +224,28 @@ def prompt_multi_choice(options: list[dict[str, Any]], title: str, label_key: st
 
 
 def print_table(
-    title: str, rows: Sequence[Sequence[str]], headers: Sequence[str], *, show_lines: bool = False
+    title: str, rows: Iterable[Sequence[str]], headers: Sequence[str], *, show_lines: bool = False
 ) -> None:
-    table = Table(title=title, show_lines=show_lines)
-    for h in headers:
-        table.add_column(h)
-    for row in rows:
-        table.add_row(*[str(x) for x in row])
-    console.print(table)
+    """Render rows as tables of at most TABLE_CHUNK_ROWS rows; only the first gets the title.
+
+    Row producers already format every cell as a string, so cells are passed through as-is.
+    """
+    from rich.table import Table  # noqa: PLC0415
+
+    row_iter = iter(rows)
+    chunk = list(islice(row_iter, TABLE_CHUNK_ROWS))
+    table_title: str | None = title
+    while True:
+        table = Table(title=table_title, show_lines=show_lines)
+        for h in headers:
+            table.add_column(h)
+        for row in chunk:
+            table.add_row(*row)
+        console.print(table)
+        chunk = list(islice(row_iter, TABLE_CHUNK_ROWS))
+        if not chunk:
+            return
+        table_title = None
 
 
 def fetch_me(settings: Settings, tokens: Any, ctx: Context | None) -> dict[str, Any]:
@@ -110,15 +256,58 @@ def fetch_years(settings: Settings, tokens: Any, ctx: Context | None) -> dict[st
     return execute_graphql(settings, tokens, queries.YEARS, {}, ctx, label="years")
 
 
+def fetch_me_and_years(settings: Settings, tokens: Any, ctx: Context | None) -> dict[str, Any]:
+    """Fetch `me` and `years` in a single GraphQL document (one round-trip)."""
+    return execute_graphql(settings, tokens, queries.ME_AND_YEARS, {}, ctx, label="me")
+
+
+@lru_cache(maxsize=1)
+def load_session(path: Path) -> AuthTokens | None:
+    """Load the saved tokens once per process; call ``cache_clear()`` after saving."""
+    return SessionStore(path).load()
+
+
 def load_tokens(settings: Settings) -> AuthTokens:
-    store = SessionStore(settings.session_file)
-    tokens = store.load()
+    tokens = load_session(settings.session_file)
     if not tokens:
         console.print("[red]No session found. Run `kidsview-cli login` first.[/red]")
         raise typer.Exit(code=1)
     return tokens
 
 
+def _is_mutation(query: str) -> bool:
+    """Whether the document's operation keyword (after whitespace/comments) is `mutation`."""
+    match = _OPERATION_KEYWORD.match(query)
+    return match is not None and match[1] == "mutation"
+
+
+def _flush_response_cache(settings: Settings, queries: Iterable[str]) -> None:
+    """Mutations invalidate every cached read."""
+    if settings.cache_ttl > 0 and any(map(_is_mutation, queries)):
+        ResponseCache(settings.cache_file).clear()
+
+
+def _response_cache_key(
+    settings: Settings,
+    tokens: AuthTokens,
+    query: str,
+    variables: dict[str, Any] | None,
+    ctx: Context | None,
+) -> str | None:
+    """Cache key for a read-only query when KIDSVIEW_CACHE_TTL is set (None otherwise)."""
+    if settings.cache_ttl <= 0 or _is_mutation(query):
+        return None
+    return cache_key(
+        query,
+        variables,
+        settings.api_url,
+        settings.cookies or "",
+        ctx.model_dump_json() if ctx else "",
+        # The refresh token outlives id-token refreshes, so cached entries survive them.
+        tokens.refresh_token or tokens.id_token,
+    )
+
+
 def execute_graphql(  # noqa: PLR0913
     settings: Settings,
     tokens: AuthTokens,
@@ -128,6 +317,12 @@ def execute_graphql(  # noqa: PLR0913
     label: str = "GraphQL",
 ) -> dict[str, Any]:
     """Execute a GraphQL query, auto-refreshing token once on failure."""
+    _flush_response_cache(settings, (query,))
+    key = _response_cache_key(settings, tokens, query, variables, ctx)
+    if key is not None:
+        cached = ResponseCache(settings.cache_file).get(key, settings.cache_ttl)
+        if cached is not None:
+            return cached
     store = SessionStore(settings.session_file)
     attempts = 0
     current_tokens = tokens
@@ -135,10 +330,13 @@ def execute_graphql(  # noqa: PLR0913
 
     max_attempts = 2
     while attempts < max_attempts:
-        client = GraphQLClient(settings, current_tokens, context=ctx)
+        client = GraphQLClient(settings, current_tokens, context=ctx, http=http_client())
         try:
-            data = asyncio.run(client.execute(query, variables))
-            return data if isinstance(data, dict) else {}
+            data = run(client.execute(query, variables))
+            result = data if isinstance(data, dict) else {}
+            if key is not None:
+                ResponseCache(settings.cache_file).put(key, result, settings.cache_ttl)
+            return result
         except ApiError as exc:
             last_error = exc
             if attempts == 0 and current_tokens.refresh_token:
@@ -146,6 +344,7 @@ def execute_graphql(  # noqa: PLR0913
                 try:
                     refreshed = run(AuthClient(settings).refresh(current_tokens.refresh_token))
                     store.save(refreshed)
+                    load_session.cache_clear()
                     current_tokens = refreshed
                     attempts += 1
                     continue
@@ -175,13 +374,137 @@ def execute_graphql(  # noqa: PLR0913
     raise typer.Exit(code=1) from last_error
 
 
+def execute_graphql_many(  # noqa: PLR0913
+    settings: Settings,
+    tokens: AuthTokens,
+    query: str,
+    variables_list: Sequence[dict[str, Any]],
+    *,
+    ctx: Context | None,
+    label: str = "GraphQL",
+) -> list[dict[str, Any]]:
+    """Run `query` once per variables set concurrently (see `execute_graphql_ops`).
+
+    Failed calls are sent again, so `query` must be safe to repeat (e.g. marking read).
+    """
+    ops = [(query, variables) for variables in variables_list]
+    return execute_graphql_ops(settings, tokens, ops, ctx, label=label)
+
+
+def execute_graphql_ops(
+    settings: Settings,
+    tokens: AuthTokens,
+    ops: Sequence[tuple[str, dict[str, Any]]],
+    ctx: Context | None,
+    label: str = "GraphQL",
+) -> list[dict[str, Any]]:
+    """Run independent operations concurrently on the shared client.
+
+    Results come back in ``ops`` order. Read-only operations go through the response cache
+    like `execute_graphql`, and any mutation flushes it. Calls that fail are retried one by
+    one through `execute_graphql` (token refresh, error reporting), so every operation must
+    be safe to send twice.
+    """
+    _flush_response_cache(settings, (query for query, _ in ops))
+    cache = ResponseCache(settings.cache_file)
+    keys = [_response_cache_key(settings, tokens, *op, ctx) for op in ops]
+    results = [None if key is None else cache.get(key, settings.cache_ttl) for key in keys]
+    pending = [i for i, result in enumerate(results) if result is None]
+
+    client = GraphQLClient(settings, tokens, context=ctx, http=http_client())
+    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def _one(op: tuple[str, dict[str, Any]]) -> dict[str, Any]:
+        async with sem:
+            return await client.execute(*op)
+
+    async def _all() -> list[dict[str, Any] | BaseException]:
+        return await asyncio.gather(*(_one(ops[i]) for i in pending), return_exceptions=True)
+
+    for i, result in zip(pending, run(_all()), strict=True):
+        if isinstance(result, ApiError):
+            # A refresh inside execute_graphql saves new tokens; pick them up for later retries.
+            tokens = load_session(settings.session_file) or tokens
+            query, variables = ops[i]
+            results[i] = execute_graphql(settings, tokens, query, variables, ctx, label=label)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            results[i] = result
+            if (key := keys[i]) is not None:
+                cache.put(key, result, settings.cache_ttl)
+    # Every slot is now a cache hit or a fetched result; callers unpack by position.
+    return cast("list[dict[str, Any]]", results)
+
+
+@lru_cache(maxsize=1)
+def load_context(path: Path) -> Context | None:
+    """Load the saved context once per process; call ``cache_clear()`` after saving."""
+    return ContextStore(path).load()
+
+
+def remember_child_name(settings: Settings, ctx: Context, name: str) -> None:
+    """Save the active child's display name in the context so later runs skip `me`."""
+    ctx.child_name = name
+    ContextStore(settings.context_file).save(ctx)
+    load_context.cache_clear()
+
+
+def forget_child_name(settings: Settings) -> None:
+    """Drop the saved child's display name, e.g. after logging in as another user."""
+    store = ContextStore(settings.context_file)
+    ctx = store.load()
+    if ctx is not None and ctx.child_name is not None:
+        ctx.child_name = None
+        store.save(ctx)
+    load_context.cache_clear()
+
+
 def env() -> tuple[Settings, AuthTokens, Context | None]:
-    settings = Settings()
+    settings = get_settings()
     tokens = load_tokens(settings)
-    ctx = ContextStore(settings.context_file).load()
+    ctx = load_context(settings.context_file)
     return settings, tokens, ctx
 
 
+def extend_pages(  # noqa: PLR0913
+    settings: Settings,
+    tokens: AuthTokens,
+    query: str,
+    variables: dict[str, Any],
+    *,
+    ctx: Context | None,
+    label: str,
+    data: dict[str, Any],
+    pages: int,
+    nested: str | None = None,
+) -> None:
+    """Append up to `pages - 1` further pages of the `label` connection to `data` in place.
+
+    Each page's cursor comes from the previous response, so pages are fetched in turn.
+    With `nested`, the connection is that field of the `label` object (thread.messages).
+    """
+    conn = data.get(label)
+    if nested and isinstance(conn, dict):
+        conn = conn.get(nested)
+    if pages <= 1 or not isinstance(conn, dict):
+        return
+    edges = conn["edges"] = list(conn.get("edges") or [])
+    page_info = conn.get("pageInfo") or EMPTY
+    for _ in range(pages - 1):
+        cursor = page_info.get("endCursor")
+        if not page_info.get("hasNextPage") or not cursor:
+            break
+        page_vars = {**variables, "after": cursor}
+        page = execute_graphql(settings, tokens, query, page_vars, ctx, label=label)
+        more = page.get(label) or EMPTY
+        if nested:
+            more = more.get(nested) or EMPTY
+        edges.extend(more.get("edges") or [])
+        page_info = more.get("pageInfo") or EMPTY
+    conn["pageInfo"] = page_info
+
+
 def run_query_table(  # noqa: PLR0913
     *,
     query: str,
@@ -191,19 +514,42 @@ def run_query_table(  # noqa: PLR0913
     empty_msg: str,
     headers: Sequence[str],
     title: str | Callable[[dict[str, Any]], str],
-    rows_fn: Callable[[dict[str, Any]], Sequence[Sequence[str]]],
+    rows_fn: Callable[[dict[str, Any]], Iterable[Sequence[str]]],
     show_lines: bool = False,
+    pages: int = 1,
+    nested: str | None = None,
 ) -> None:
-    """Execute a query and render either JSON or table using a row builder."""
+    """Execute a query and render either JSON or table using a row builder.
+
+    With `pages` > 1 the `label` connection (or its `nested` field) is followed through
+    its end cursor.
+    """
     settings, tokens, context = env()
-    payload_data = execute_graphql(settings, tokens, query, variables or {}, context, label=label)
+    # Unset command options are left out rather than sent as null; none of them stands in
+    # for a variable with a declared default, so the server resolves both the same way.
+    variables = {k: v for k, v in (variables or {}).items() if v is not None}
+    payload_data = execute_graphql(settings, tokens, query, variables, context, label=label)
+    extend_pages(
+        settings,
+        tokens,
+        query,
+        variables,
+        ctx=context,
+        label=label,
+        data=payload_data,
+        pages=pages,
+        nested=nested,
+    )
     payload = {label: payload_data.get(label)}
     if json_output:
-        console.print_json(data=payload)
+        print_json(payload)
         return
-    rows = rows_fn(payload)
-    if not rows:
+    # rows_fn may return a lazy iterator; peek one row for the empty check and feed the
+    # rest straight into the table without building an intermediate list.
+    rows = iter(rows_fn(payload))
+    first = next(rows, None)
+    if first is None:
         console.print(empty_msg)
         return
     title_val = title(payload) if callable(title) else title
-    print_table(title_val, rows, headers, show_lines=show_lines)
+    print_table(title_val, chain((first,), rows), headers, show_lines=show_lines)
@@ -825,264 +825,286 @@ mutation createThread($input: CreateThreadInput!) {
 }
 """
 
-ME = """
-query me {
-  me {
+ME_FIELDS = """
+fragment meFields on KidsViewBaseUserNode {
+  id
+  subclassId
+  firstName
+  lastName
+  fullName
+  email
+  phone
+  address
+  zipcode
+  city
+  pesel
+  employmentDate
+  employeeTosAccepted
+  employeePrivacyPolicyAccepted
+  medicalExaminationsValidUntil
+  ohsTrainingValidUntil
+  firstAidCourseValidUntil
+  vacationDaysTotal
+  customPositionName
+  memberOfGuardiansPersonnelChats
+  alerts { field text }
+  availablePreschools {
     id
-    subclassId
-    firstName
-    lastName
-    fullName
-    email
-    phone
+    avatar
+    name
     address
     zipcode
     city
-    pesel
-    employmentDate
-    employeeTosAccepted
-    employeePrivacyPolicyAccepted
-    medicalExaminationsValidUntil
-    ohsTrainingValidUntil
-    firstAidCourseValidUntil
-    vacationDaysTotal
-    customPositionName
-    memberOfGuardiansPersonnelChats
-    alerts { field text }
-    availablePreschools {
+    voivodeship
+    county
+    district
+    phone
+    email
+    nip
+    registerCode
+    transferCode
+    bankAccount
+    blockEditBankAccount
+    archiveAnnouncements
+    preschoolCode
+    sellerOption
+    customSellerName
+    customSellerAddress
+    customSellerZipcode
+    customSellerCity
+    customSellerNip
+    dataAdminOption
+    customDataAdminName
+    customDataAdminAddress
+    customDataAdminZipcode
+    customDataAdminCity
+    absenceDeadlineDaysBefore
+    absenceDeadlineHour
+    mealRefundDeadlineDaysBefore
+    mealRefundDeadlineHour
+    displayDropOffAndPickUpTime
+    billingPeriodRecalculation
+    galleryComments
+    registeredPickup
+    paymentDay
+    paymentDayOption
+    paymentDayAfterInvoice
+    accrueInterest
+    interestAmount
+    pinCodeAttendanceEnabled
+    preschoolChain { organisationName }
+    currentCurriculum {
       id
-      avatar
       name
-      address
-      zipcode
-      city
-      voivodeship
-      county
-      district
-      phone
-      email
-      nip
-      registerCode
-      transferCode
-      bankAccount
-      blockEditBankAccount
-      archiveAnnouncements
-      preschoolCode
-      sellerOption
-      customSellerName
-      customSellerAddress
-      customSellerZipcode
-      customSellerCity
-      customSellerNip
-      dataAdminOption
-      customDataAdminName
-      customDataAdminAddress
-      customDataAdminZipcode
-      customDataAdminCity
-      absenceDeadlineDaysBefore
-      absenceDeadlineHour
-      mealRefundDeadlineDaysBefore
-      mealRefundDeadlineHour
-      displayDropOffAndPickUpTime
-      billingPeriodRecalculation
-      galleryComments
-      registeredPickup
-      paymentDay
-      paymentDayOption
-      paymentDayAfterInvoice
-      accrueInterest
-      interestAmount
-      pinCodeAttendanceEnabled
-      preschoolChain { organisationName }
-      currentCurriculum {
-        id
-        name
-        year
-        developmentAreaItems {
-          edges {
-            node {
-              id
-              description
-              ordinalNumber
-              curriculumCoreOrdinalNumber
-              achievements { edges { node { id description ordinalNumber } } }
-            }
-          }
-        }
-      }
-      keyCompetences: keyCompetencesPreschoolAssociation { id name }
-      additionalAccounts {
+      year
+      developmentAreaItems {
         edges {
           node {
             id
-            accountName
-            accountNumber
-            isReadyToDelete
-            isAdditionalSeller
-            sellerName
-            sellerAddress
-            sellerCity
-            sellerZipcode
-            sellerNip
-            additionalSellerBilling {
-              applyBillNumbering
-              billNumberingIndividualTag
-              billNumberingIndividualTagSeparator
-              billNumberingStartNumber
-              billNumberingIsAnnual
-              billNumberingStartMonth
-              billNumberingStartYear
-              billNumberingSuffix
-              billNumberingSuffixSeparator
-              applyInvoiceNumbering
-              invoiceNumberingIndividualTag
-              invoiceNumberingIndividualTagSeparator
-              invoiceStartNumber
-              invoiceNumberingIsAnnual
-              invoiceNumberingStartMonth
-              invoiceNumberingStartYear
-              invoiceNumberingSuffix
-              invoiceNumberingSuffixSeparator
-              correctionNumberingIndividualTag
-              correctionNumberingIndividualTagSeparator
-              correctionStartNumber
-              correctionNumberingIsAnnual
-              correctionNumberingStartMonth
-              correctionNumberingStartYear
-              correctionNumberingSuffix
-              correctionNumberingSuffixSeparator
-            }
+            description
+            ordinalNumber
+            curriculumCoreOrdinalNumber
+            achievements { edges { node { id description ordinalNumber } } }
           }
         }
       }
-      paymentReminderEmailSubject
-      paymentReminderEmailContent
-      showAdditionalActivitiesParents
-      showAdditionalActivitiesEmployees
-      showIndividualActivitiesParents
-      showIndividualActivitiesEmployees
-      parentsCanMessageParents
-      parentsCanMessagePersonnel
-      parentsCanAddGuardians
-      parentsCustomPermissions { code }
-      displayIndividualActivitiesForParents
-      displayAttendanceForParents
-      displayActivityBillingDetailsForParents
-      employeesSeeMessagesForModeration
-      guardiansPersonnelGroupChats
-      disableBankTransferPayments
-      applyBillNumbering
-      billNumberingIndividualTag
-      billNumberingIndividualTagSeparator
-      billNumberingStartNumber
-      billNumberingIsAnnual
-      billNumberingStartMonth
-      billNumberingStartYear
-      billNumberingSuffix
-      billNumberingSuffixSeparator
-      applyInvoiceNumbering
-      invoiceNumberingIndividualTag
-      invoiceNumberingIndividualTagSeparator
-      invoiceStartNumber
-      invoiceNumberingIsAnnual
-      invoiceNumberingStartMonth
-      invoiceNumberingStartYear
-      invoiceNumberingSuffix
-      invoiceNumberingSuffixSeparator
-      invoiceText
-      correctionNumberingIndividualTag
-      correctionNumberingIndividualTagSeparator
-      correctionStartNumber
-      correctionNumberingIsAnnual
-      correctionNumberingStartMonth
-      correctionNumberingStartYear
-      correctionNumberingSuffix
-      correctionNumberingSuffixSeparator
-      employeeFeeName
-      employeeFeeRate
-      dayStartTime
-      dayEndTime
-      dayStartTimeAsNumber
-      dayEndTimeAsNumber
-      autoSetTeaHour
-      autoSetDinnerHour
-      autoSetBreakfastHour
-      autoSetDailyActivities
-      advencedMealsRating
-      invoiceSetType
-      directors { fullName }
-      aboutAppPage
-      termsOfUsePage
-      privacyPolicyPage
-      employeeRoles { edges { node { id name permissions } } }
-      employees { edges { node { id position role { id name } } } }
-      years {
-        edges {
-          node {
+    }
+    keyCompetences: keyCompetencesPreschoolAssociation { id name }
+    additionalAccounts {
+      edges {
+        node {
+          id
+          accountName
+          accountNumber
+          isReadyToDelete
+          isAdditionalSeller
+          sellerName
+          sellerAddress
+          sellerCity
+          sellerZipcode
+          sellerNip
+          additionalSellerBilling {
+            applyBillNumbering
+            billNumberingIndividualTag
+            billNumberingIndividualTagSeparator
+            billNumberingStartNumber
+            billNumberingIsAnnual
+            billNumberingStartMonth
+            billNumberingStartYear
+            billNumberingSuffix
+            billNumberingSuffixSeparator
+            applyInvoiceNumbering
+            invoiceNumberingIndividualTag
+            invoiceNumberingIndividualTagSeparator
+            invoiceStartNumber
+            invoiceNumberingIsAnnual
+            invoiceNumberingStartMonth
+            invoiceNumberingStartYear
+            invoiceNumberingSuffix
+            invoiceNumberingSuffixSeparator
+            correctionNumberingIndividualTag
+            correctionNumberingIndividualTagSeparator
+            correctionStartNumber
+            correctionNumberingIsAnnual
+            correctionNumberingStartMonth
+            correctionNumberingStartYear
+            correctionNumberingSuffix
+            correctionNumberingSuffixSeparator
+          }
+        }
+      }
+    }
+    paymentReminderEmailSubject
+    paymentReminderEmailContent
+    showAdditionalActivitiesParents
+    showAdditionalActivitiesEmployees
+    showIndividualActivitiesParents
+    showIndividualActivitiesEmployees
+    parentsCanMessageParents
+    parentsCanMessagePersonnel
+    parentsCanAddGuardians
+    parentsCustomPermissions { code }
+    displayIndividualActivitiesForParents
+    displayAttendanceForParents
+    displayActivityBillingDetailsForParents
+    employeesSeeMessagesForModeration
+    guardiansPersonnelGroupChats
+    disableBankTransferPayments
+    applyBillNumbering
+    billNumberingIndividualTag
+    billNumberingIndividualTagSeparator
+    billNumberingStartNumber
+    billNumberingIsAnnual
+    billNumberingStartMonth
+    billNumberingStartYear
+    billNumberingSuffix
+    billNumberingSuffixSeparator
+    applyInvoiceNumbering
+    invoiceNumberingIndividualTag
+    invoiceNumberingIndividualTagSeparator
+    invoiceStartNumber
+    invoiceNumberingIsAnnual
+    invoiceNumberingStartMonth
+    invoiceNumberingStartYear
+    invoiceNumberingSuffix
+    invoiceNumberingSuffixSeparator
+    invoiceText
+    correctionNumberingIndividualTag
+    correctionNumberingIndividualTagSeparator
+    correctionStartNumber
+    correctionNumberingIsAnnual
+    correctionNumberingStartMonth
+    correctionNumberingStartYear
+    correctionNumberingSuffix
+    correctionNumberingSuffixSeparator
+    employeeFeeName
+    employeeFeeRate
+    dayStartTime
+    dayEndTime
+    dayStartTimeAsNumber
+    dayEndTimeAsNumber
+    autoSetTeaHour
+    autoSetDinnerHour
+    autoSetBreakfastHour
+    autoSetDailyActivities
+    advencedMealsRating
+    invoiceSetType
+    directors { fullName }
+    aboutAppPage
+    termsOfUsePage
+    privacyPolicyPage
+    employeeRoles { edges { node { id name permissions } } }
+    employees { edges { node { id position role { id name } } } }
+    years {
+      edges {
+        node {
+          id
+          startDate
+          isOpen
+          displayName
+          months {
             id
+            monthNumber
             startDate
-            isOpen
-            displayName
-            months {
-              id
-              monthNumber
-              startDate
-              endDate
-              isActive
-              isCurrent
-              year { id yearNumber }
-            }
+            endDate
+            isActive
+            isCurrent
+            year { id yearNumber }
           }
         }
       }
-      mealsDailyManagement
-      mealsDailyManagementParent
-      displaySubjectsForParents
-      mealReportEmail
-      mealReportEmailSubject
-      mealReportEmailBody
-      mealReportTime
-      mealReportSchedule
-      secondMealReportTime
-      secondMealReportSchedule
-      canGenerateQrCode
-      extendedMealSystem
-      meals { id name excludedFromPartialRefund }
-      institutionType
-      fullWeekCalendar
     }
-    availablePreschoolChains { id name avatar }
-    permissions
+    mealsDailyManagement
+    mealsDailyManagementParent
+    displaySubjectsForParents
+    mealReportEmail
+    mealReportEmailSubject
+    mealReportEmailBody
+    mealReportTime
+    mealReportSchedule
+    secondMealReportTime
+    secondMealReportSchedule
+    canGenerateQrCode
+    extendedMealSystem
+    meals { id name excludedFromPartialRefund }
+    institutionType
+    fullWeekCalendar
+  }
+  availablePreschoolChains { id name avatar }
+  permissions
+  avatar
+  userPosition
+  userType
+  unreadNotificationsCount
+  unreadMessagesCount
+  tosAccepted
+  marketingAgreementAccepted
+  appLoggedIn
+  calendarNotificationsEnabled
+  paymentNotificationsEnabled
+  behaviorNotificationsEnabled
+  announcementNotificationsEnabled
+  messageNotificationsEnabled
+  galleryNotificationsEnabled
+  appHomeScreen
+  children {
+    name
+    surname
     avatar
-    userPosition
-    userType
-    unreadNotificationsCount
-    unreadMessagesCount
-    tosAccepted
-    marketingAgreementAccepted
-    appLoggedIn
-    calendarNotificationsEnabled
-    paymentNotificationsEnabled
-    behaviorNotificationsEnabled
-    announcementNotificationsEnabled
-    messageNotificationsEnabled
-    galleryNotificationsEnabled
-    appHomeScreen
-    children {
-      name
-      surname
-      avatar
-      group { id name }
-      id
-      avatar
-    }
-    subAccounts { id subAccountDescription }
-    eduManagerBlogEditor
-    dayStartTime
-    dayEndTime
+    group { id name }
+    id
+    avatar
+  }
+  subAccounts { id subAccountDescription }
+  eduManagerBlogEditor
+  dayStartTime
+  dayEndTime
+}
+"""
+
+ME = (
+    """
+query me {
+  me { ...meFields }
+}
+"""
+    + ME_FIELDS
+)
+
+ME_AND_YEARS = (
+    """
+query meAndYears {
+  me { ...meFields }
+  years {
+    id
+    displayName
+    startDate
+    endDate
   }
 }
 """
+    + ME_FIELDS
+)
 
 COLORS = """
 query colors {
@@ -0,0 +1,18 @@
+from collections.abc import Iterator
+
+import pytest
+
+from kidsview_cli.config import get_settings
+from kidsview_cli.helpers import load_context, load_session
+
+
+@pytest.fixture(autouse=True)
+def _reset_process_caches() -> Iterator[None]:
+    """Each test sets its own KIDSVIEW_* env, so drop settings/session/context cached earlier."""
+    get_settings.cache_clear()
+    load_context.cache_clear()
+    load_session.cache_clear()
+    yield
+    get_settings.cache_clear()
+    load_context.cache_clear()
+    load_session.cache_clear()
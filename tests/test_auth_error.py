@@ -23,7 +23,7 @@ def test_login_failure_raises_auth_error():
     settings = Settings(user_pool_id="pool", client_id="client", region="region")
     client = AuthClient(settings)
 
-    with patch("kidsview_cli.auth.Cognito") as mock_cognito:
+    with patch("pycognito.Cognito") as mock_cognito:
         mock_instance = mock_cognito.return_value
         mock_instance.authenticate.side_effect = Exception("Cognito error")
 
@@ -42,7 +42,7 @@ def test_refresh_failure_raises_auth_error():
     settings = Settings(user_pool_id="pool", client_id="client", region="region")
     client = AuthClient(settings)
 
-    with patch("kidsview_cli.auth.Cognito") as mock_cognito:
+    with patch("pycognito.Cognito") as mock_cognito:
         mock_instance = mock_cognito.return_value
         mock_instance.renew_access_token.side_effect = Exception("Refresh failed")
 
@@ -0,0 +1,101 @@
+from pathlib import Path
+
+import orjson
+import respx
+from httpx import Response
+from typer.testing import CliRunner
+
+from kidsview_cli.cache import ResponseCache, cache_key
+from kidsview_cli.cli import app
+from kidsview_cli.config import Settings
+from kidsview_cli.helpers import execute_graphql
+from kidsview_cli.session import AuthTokens, SessionStore
+
+runner = CliRunner()
+
+
+def test_response_cache_roundtrip_and_ttl(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path / "cache.sqlite")
+    assert cache.get("k", 60) is None
+
+    cache.put("k", {"me": {"id": "1"}}, 60)
+    assert cache.get("k", 60) == {"me": {"id": "1"}}
+    assert cache.get("k", -1) is None
+    assert cache.path.stat().st_mode & 0o077 == 0
+
+    cache.clear()
+    assert cache.get("k", 60) is None
+
+
+def test_response_cache_put_prunes_expired_rows(tmp_path: Path, monkeypatch) -> None:
+    cache = ResponseCache(tmp_path / "cache.sqlite")
+    monkeypatch.setattr("kidsview_cli.cache.time.time", lambda: 1000.0)
+    cache.put("old", {"me": {"id": "1"}}, 60)
+
+    monkeypatch.setattr("kidsview_cli.cache.time.time", lambda: 1100.0)
+    cache.put("new", {"me": {"id": "2"}}, 60)
+
+    # The stale row is gone from disk, not merely hidden by a short ttl.
+    assert cache.get("old", 10_000) is None
+    assert cache.get("new", 60) == {"me": {"id": "2"}}
+
+
+def test_cache_key_ignores_variable_order() -> None:
+    a = cache_key("query q", {"a": 1, "b": 2}, "user")
+    assert a == cache_key("query q", {"b": 2, "a": 1}, "user")
+    assert a != cache_key("query q", {"a": 1, "b": 2}, "other")
+
+
+@respx.mock
+def test_execute_graphql_reuses_cached_reads(tmp_path: Path) -> None:
+    settings = Settings(
+        cache_ttl=60,
+        cache_file=tmp_path / "cache.sqlite",
+        session_file=tmp_path / "session.json",
+    )
+    tokens = AuthTokens(id_token="id", access_token="acc", refresh_token="r")
+    route = respx.post(settings.api_url).mock(
+        return_value=Response(200, json={"data": {"me": {"id": "1"}}})
+    )
+
+    for _ in range(2):
+        assert execute_graphql(settings, tokens, "query me { me { id } }", None, None) == {
+            "me": {"id": "1"}
+        }
+    assert route.call_count == 1
+
+    # A mutation flushes cached reads.
+    execute_graphql(settings, tokens, "mutation m { x }", None, None)
+    execute_graphql(settings, tokens, "query me { me { id } }", None, None)
+    assert route.call_count == 3
+
+
+@respx.mock
+def test_mark_read_flushes_cached_notifications(tmp_path: Path, monkeypatch) -> None:
+    session_file = tmp_path / "session.json"
+    SessionStore(session_file).save(AuthTokens(id_token="id", access_token="acc"))
+    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(session_file))
+    monkeypatch.setenv("KIDSVIEW_CACHE_FILE", str(tmp_path / "cache.sqlite"))
+    monkeypatch.setenv("KIDSVIEW_CACHE_TTL", "60")
+    sent: list[str] = []
+
+    def handler(request):
+        query = orjson.loads(request.content)["query"]
+        sent.append("mark" if "setNotificationRead" in query else "list")
+        if sent[-1] == "mark":
+            return Response(200, json={"data": {"setNotificationRead": {"success": True}}})
+        node = {"id": "n1", "isRead": "mark" in sent, "notification": {"id": "N1"}}
+        conn = {"edges": [{"node": node}], "pageInfo": {"hasNextPage": False}}
+        return Response(200, json={"data": {"notifications": conn}})
+
+    respx.post("https://backend.kidsview.pl/graphql").mock(side_effect=handler)
+
+    assert runner.invoke(app, ["notifications", "--json"]).exit_code == 0
+    assert runner.invoke(app, ["notifications", "--mark-read", "--json"]).exit_code == 0
+    assert sent == ["list", "mark"]
+
+    # The mutation flushed the cached page, so the next read sees the server's state.
+    result = runner.invoke(app, ["notifications", "--json"])
+    assert result.exit_code == 0
+    assert sent == ["list", "mark", "list"]
+    assert orjson.loads(result.stdout)["notifications"]["edges"][0]["node"]["isRead"] is True
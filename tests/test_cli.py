@@ -1,11 +1,14 @@
+import importlib
 import json
 from pathlib import Path
 
 import respx
+import typer
+import typer.main
 from httpx import Response
 from typer.testing import CliRunner
 
-from kidsview_cli.cli import app
+from kidsview_cli.cli import LAZY_COMMANDS, LazyGroup, app
 from kidsview_cli.context import Context, ContextStore
 from kidsview_cli.session import AuthTokens, SessionStore
 
@@ -40,6 +43,32 @@ def test_announcements_json(tmp_path: Path, monkeypatch) -> None:
     assert route.called
 
 
+@respx.mock
+def test_announcements_pages_follow_cursor(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(_make_session(tmp_path)))
+
+    def page(title: str, has_next: bool) -> Response:
+        conn = {
+            "edges": [{"node": {"title": title}}],
+            "pageInfo": {"endCursor": f"after-{title}", "hasNextPage": has_next},
+        }
+        return Response(200, json={"data": {"announcements": conn}})
+
+    route = respx.post("https://backend.kidsview.pl/graphql").mock(
+        side_effect=[page("A", True), page("B", False)]
+    )
+    result = runner.invoke(app, ["announcements", "--pages", "3", "--json"])
+
+    assert result.exit_code == 0
+    assert route.call_count == 2
+    # The unset --after option is left out of the first request instead of sent as null.
+    assert "after" not in json.loads(route.calls[0].request.content)["variables"]
+    assert json.loads(route.calls[1].request.content)["variables"]["after"] == "after-A"
+    data = json.loads(result.stdout)["announcements"]
+    assert [e["node"]["title"] for e in data["edges"]] == ["A", "B"]
+    assert data["pageInfo"]["hasNextPage"] is False
+
+
 @respx.mock
 def test_announcements_pretty(tmp_path: Path, monkeypatch) -> None:
     session_path = _make_session(tmp_path)
@@ -77,6 +106,30 @@ def test_graphql_errors_raise(tmp_path: Path, monkeypatch) -> None:
     assert "failed" in result.stdout
 
 
+def test_graphql_rejects_invalid_vars(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(_make_session(tmp_path)))
+    result = runner.invoke(app, ["graphql", "-q", "query { __typename }", "-v", "{bad"])
+
+    assert result.exit_code == 1
+    assert "Invalid JSON for variables" in result.stdout
+
+
+def test_graphql_rejects_non_object_vars(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(_make_session(tmp_path)))
+    result = runner.invoke(app, ["graphql", "-q", "query { __typename }", "-v", "[1]"])
+
+    assert result.exit_code == 1
+    assert "Variables must be a JSON object" in result.stdout
+
+
+def test_graphql_reports_missing_query_file(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(_make_session(tmp_path)))
+    result = runner.invoke(app, ["graphql", "-q", f"@{tmp_path / 'missing.graphql'}"])
+
+    assert result.exit_code == 1
+    assert "Query file not found" in result.stdout
+
+
 @respx.mock
 def test_chat_send_uses_recipients(tmp_path: Path, monkeypatch) -> None:
     session_path = _make_session(tmp_path)
@@ -109,11 +162,8 @@ def test_chat_send_uses_recipients(tmp_path: Path, monkeypatch) -> None:
     assert sent["headers"]["Authorization"] == "JWT IDTOKEN"
 
 
-@respx.mock
-def test_notifications_filter_and_pretty(tmp_path: Path, monkeypatch) -> None:
-    session_path = _make_session(tmp_path)
-    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(session_path))
-    notif_payload = {
+def _event_notifications() -> dict:
+    return {
         "data": {
             "notifications": {
                 "edges": [
@@ -141,8 +191,14 @@ def test_notifications_filter_and_pretty(tmp_path: Path, monkeypatch) -> None:
             }
         }
     }
+
+
+@respx.mock
+def test_notifications_filter_and_pretty(tmp_path: Path, monkeypatch) -> None:
+    session_path = _make_session(tmp_path)
+    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(session_path))
     respx.post("https://backend.kidsview.pl/graphql").mock(
-        return_value=Response(200, json=notif_payload)
+        return_value=Response(200, json=_event_notifications())
     )
     result = runner.invoke(app, ["notifications", "--type", "upcoming_event"])
 
@@ -151,6 +207,20 @@ def test_notifications_filter_and_pretty(tmp_path: Path, monkeypatch) -> None:
     assert "NEW_EVENT" not in result.stdout
 
 
+@respx.mock
+def test_notifications_pretty_shows_payload_date(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(_make_session(tmp_path)))
+    respx.post("https://backend.kidsview.pl/graphql").mock(
+        return_value=Response(200, json=_event_notifications())
+    )
+    result = runner.invoke(app, ["notifications"])
+
+    assert result.exit_code == 0
+    assert "UPCOMING_EVENT" in result.stdout
+    assert "NEW_EVENT" in result.stdout
+    assert "2025-01-02" in result.stdout
+
+
 @respx.mock
 def test_notifications_only_unread_and_mark(tmp_path: Path, monkeypatch) -> None:
     session_path = _make_session(tmp_path)
@@ -500,6 +570,59 @@ def test_chat_threads_and_messages(tmp_path: Path, monkeypatch) -> None:
     assert "hello" in result2.stdout
 
 
+@respx.mock
+def test_chat_messages_follows_pages(tmp_path: Path, monkeypatch) -> None:
+    session_path = _make_session(tmp_path)
+    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(session_path))
+    afters: list[str | None] = []
+
+    def handler(request):
+        variables = json.loads(request.content)["variables"]
+        afters.append(variables.get("after"))
+        page = len(afters)
+        return Response(
+            200,
+            json={
+                "data": {
+                    "thread": {
+                        "id": "T1",
+                        "name": "Thread1",
+                        "messages": {
+                            "pageInfo": {"endCursor": f"c{page}", "hasNextPage": page < 2},
+                            "edges": [{"node": {"id": f"M{page}", "text": f"msg{page}"}}],
+                        },
+                    }
+                }
+            },
+        )
+
+    respx.post("https://backend.kidsview.pl/graphql").mock(side_effect=handler)
+
+    result = runner.invoke(app, ["chat-messages", "--thread-id", "T1", "--pages", "5", "--json"])
+    assert result.exit_code == 0
+    assert afters == [None, "c1"]
+    data = json.loads(result.stdout)
+    assert [e["node"]["id"] for e in data["thread"]["messages"]["edges"]] == ["M1", "M2"]
+    assert data["thread"]["messages"]["pageInfo"]["hasNextPage"] is False
+
+
+@respx.mock
+def test_chat_messages_pages_stop_without_end_cursor(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(_make_session(tmp_path)))
+    messages = {
+        "pageInfo": {"endCursor": None, "hasNextPage": True},
+        "edges": [{"node": {"id": "M1", "text": "msg1"}}],
+    }
+    route = respx.post("https://backend.kidsview.pl/graphql").mock(
+        return_value=Response(200, json={"data": {"thread": {"id": "T1", "messages": messages}}})
+    )
+
+    result = runner.invoke(app, ["chat-messages", "--thread-id", "T1", "--pages", "3"])
+    assert result.exit_code == 0
+    assert route.call_count == 1
+    assert result.stdout.count("msg1") == 1
+
+
 @respx.mock
 def test_application_submit(tmp_path: Path, monkeypatch) -> None:
     session_path = _make_session(tmp_path)
@@ -522,6 +645,10 @@ def test_application_submit(tmp_path: Path, monkeypatch) -> None:
     assert vars["commentParent"] == "Ok"
     assert vars["months"] == 3
 
+    result = runner.invoke(app, ["application-submit", "--form-id", "FORM1", "--json"])
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == {"createApplication": {"success": True, "id": "APP1"}}
+
 
 @respx.mock
 def test_payments_summary_table(tmp_path: Path, monkeypatch) -> None:
@@ -592,6 +719,16 @@ def test_payment_orders_table(tmp_path: Path, monkeypatch) -> None:
     assert result.exit_code == 0
     assert "PO1" in result.stdout
 
+    result = runner.invoke(app, ["payment-orders", "--created-from", "today"])
+    assert result.exit_code == 0
+    assert "No payment orders." in result.stdout
+
+    result = runner.invoke(
+        app, ["payment-orders", "--status", "pending", "--created-from", "2025-12-01"]
+    )
+    assert result.exit_code == 0
+    assert "PO1" in result.stdout
+
 
 @respx.mock
 def test_payments_summary_permission_denied(tmp_path: Path, monkeypatch) -> None:
@@ -651,6 +788,19 @@ def test_calendar_pretty(tmp_path: Path, monkeypatch) -> None:
     assert "Reporter" in result.stdout
 
 
+@respx.mock
+def test_calendar_empty(tmp_path: Path, monkeypatch) -> None:
+    session_path = _make_session(tmp_path)
+    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(session_path))
+    respx.post("https://backend.kidsview.pl/graphql").mock(
+        return_value=Response(200, json={"data": {"calendar": []}})
+    )
+    result = runner.invoke(app, ["calendar", "--week"])
+
+    assert result.exit_code == 0
+    assert "No calendar entries." in result.stdout
+
+
 @respx.mock
 def test_payment_components_table(tmp_path: Path, monkeypatch) -> None:
     session_path = _make_session(tmp_path)
@@ -782,7 +932,9 @@ def test_employee_roles_table(tmp_path: Path, monkeypatch) -> None:
         return_value=Response(
             200,
             json={
-                "data": {"employeeRoles": [{"id": "ER1", "name": "Teacher", "permissions": ["P1"]}]}
+                "data": {
+                    "employeeRoles": [{"id": "ER1", "name": "Teacher", "permissions": ["P1", 2]}]
+                }
             },
         )
     )
@@ -790,6 +942,7 @@ def test_employee_roles_table(tmp_path: Path, monkeypatch) -> None:
     assert result.exit_code == 0
     assert "ER1" in result.stdout
     assert "Teacher" in result.stdout
+    assert "P1, 2" in result.stdout
 
 
 @respx.mock
@@ -917,3 +1070,223 @@ def test_me_shows_years_without_extra_query(tmp_path: Path, monkeypatch) -> None
     result = runner.invoke(app, ["me"])
     assert result.exit_code == 0
     assert "2024/25" in result.stdout
+
+
+@respx.mock
+def test_unread_json_is_machine_readable(tmp_path: Path, monkeypatch) -> None:
+    session_path = _make_session(tmp_path)
+    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(session_path))
+    respx.post("https://backend.kidsview.pl/graphql").mock(
+        return_value=Response(
+            200,
+            json={"data": {"me": {"unreadNotificationsCount": 3, "unreadMessagesCount": 0}}},
+        )
+    )
+    result = runner.invoke(app, ["unread", "--json"])
+
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == {
+        "me": {"unreadNotificationsCount": 3, "unreadMessagesCount": 0}
+    }
+
+
+@respx.mock
+def test_unread_table_shows_null_counters_as_zero(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(_make_session(tmp_path)))
+    respx.post("https://backend.kidsview.pl/graphql").mock(
+        return_value=Response(
+            200,
+            json={"data": {"me": {"unreadNotificationsCount": None, "unreadMessagesCount": 4}}},
+        )
+    )
+    result = runner.invoke(app, ["unread"])
+
+    assert result.exit_code == 0
+    assert "None" not in result.stdout
+    assert "0" in result.stdout
+    assert "4" in result.stdout
+
+
+def test_lazy_commands_cover_command_modules() -> None:
+    for module_name in {mod for mod, _ in LAZY_COMMANDS.values()}:
+        module = importlib.import_module(f"kidsview_cli.commands.{module_name}")
+        sub = typer.Typer()
+        getattr(module, f"register_{module_name}")(sub)
+        registered = {
+            name: command.help for name, command in typer.main.get_group(sub).commands.items()
+        }
+        expected = {
+            name: summary for name, (mod, summary) in LAZY_COMMANDS.items() if mod == module_name
+        }
+        assert registered == expected
+
+
+def test_root_help_lists_lazy_commands_without_loading_them(monkeypatch) -> None:
+    def _fail(self, module_name: str) -> None:
+        raise AssertionError(f"{module_name} loaded for --help")
+
+    monkeypatch.setattr(LazyGroup, "_load", _fail)
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    assert "notification-prefs" in result.stdout
+    assert "Show or update notification preferences." in result.stdout
+
+
+def test_completion_lists_lazy_commands_without_loading_them(monkeypatch) -> None:
+    def _fail(self, module_name: str) -> None:
+        raise AssertionError(f"{module_name} loaded for completion")
+
+    monkeypatch.setattr(LazyGroup, "_load", _fail)
+    result = runner.invoke(
+        app,
+        [],
+        env={"_KIDSVIEW_CLI_COMPLETE": "complete_zsh", "_TYPER_COMPLETE_ARGS": "kidsview-cli pay"},
+        prog_name="kidsview-cli",
+    )
+    assert result.exit_code == 0
+    assert '"payments-summary":"Fetch payments summary (balances per child)."' in result.stdout
+
+
+def test_session_show_tokens_json(tmp_path: Path, monkeypatch) -> None:
+    session_path = _make_session(tmp_path)
+    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(session_path))
+    result = runner.invoke(app, ["session", "--show-tokens"])
+    assert result.exit_code == 0
+    tokens_json = result.stdout[result.stdout.index("{") :]
+    assert json.loads(tokens_json)["id_token"] == "IDTOKEN"
+
+
+@respx.mock
+def test_dashboard_runs_queries_concurrently(tmp_path: Path, monkeypatch) -> None:
+    session_path = _make_session(tmp_path)
+    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(session_path))
+    responses = {
+        "unreadCounts": {"me": {"unreadNotificationsCount": None, "unreadMessagesCount": 1}},
+        "quickCalendar": {"quickCalendar": [{"date": "2025-01-02", "hasEvents": True}]},
+        "announcements": {
+            "announcements": {"edges": [{"node": {"title": "Picnic", "created": "2025-01-01"}}]}
+        },
+    }
+
+    def handler(request):
+        query = json.loads(request.content)["query"]
+        name = query.split("query ", 1)[1].split("(", 1)[0].split(" ", 1)[0].strip()
+        return Response(200, json={"data": responses[name]})
+
+    route = respx.post("https://backend.kidsview.pl/graphql").mock(side_effect=handler)
+    result = runner.invoke(app, ["dashboard"])
+    assert result.exit_code == 0
+    assert route.call_count == 3
+    # A null counter prints as 0 rather than "None".
+    assert "Unread notifications: 0, messages: 1" in result.stdout
+    assert "2025-01-02" in result.stdout
+    assert "Picnic" in result.stdout
+
+
+@respx.mock
+def test_observations_table_joins_ids(tmp_path: Path, monkeypatch) -> None:
+    session_path = _make_session(tmp_path)
+    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(session_path))
+    observations = {"edges": [{"node": {"id": "O1"}}, {"node": {"id": None}}, {"node": None}]}
+    respx.post("https://backend.kidsview.pl/graphql").mock(
+        return_value=Response(
+            200,
+            json={
+                "data": {
+                    "additionalActivities": {
+                        "edges": [{"node": {"name": "Judo", "observations": observations}}]
+                    }
+                }
+            },
+        )
+    )
+    result = runner.invoke(app, ["observations", "--child-id", "C1", "--activity-id", "A1"])
+    assert result.exit_code == 0
+    assert "Judo" in result.stdout
+    assert "O1, , " in result.stdout
+
+
+@respx.mock
+def test_chat_users_and_search_tables(tmp_path: Path, monkeypatch) -> None:
+    session_path = _make_session(tmp_path)
+    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(session_path))
+    responses = {
+        "usersForChat": [{"chatDisplayName": "Pani Ala", "userType": "employee"}],
+        "groupsForChat": [
+            {
+                "id": "G1",
+                "name": "Motylki",
+                "children": [{"parents": [{"chatDisplayName": "Jan"}, {"chatDisplayName": "Ewa"}]}],
+            }
+        ],
+    }
+
+    def handler(request):
+        query = json.loads(request.content)["query"]
+        label = "usersForChat" if "usersForChat" in query else "groupsForChat"
+        return Response(200, json={"data": {label: responses[label]}})
+
+    respx.post("https://backend.kidsview.pl/graphql").mock(side_effect=handler)
+    result = runner.invoke(app, ["chat-users"])
+    assert result.exit_code == 0
+    assert "Pani Ala" in result.stdout
+
+    result = runner.invoke(app, ["chat-search", "--search", "Mot"])
+    assert result.exit_code == 0
+    assert "Motylki" in result.stdout
+    assert "Jan, Ewa" in result.stdout
+
+
+@respx.mock
+def test_applications_and_colors_tables(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(_make_session(tmp_path)))
+    application = {
+        "id": "APP1",
+        "status": "NEW",
+        "applicationForm": {"name": "Trip", "status": "OPEN"},
+        "commentDirector": None,
+    }
+    preschool = {"id": "P1", "name": "Sun", "usercolorSet": {"accentColor": "#f00"}}
+
+    def handler(request):
+        if "applications" in json.loads(request.content)["query"]:
+            data = {"applications": {"edges": [{"node": application}]}}
+        else:
+            data = {"me": {"availablePreschools": [preschool]}}
+        return Response(200, json={"data": data})
+
+    respx.post("https://backend.kidsview.pl/graphql").mock(side_effect=handler)
+
+    result = runner.invoke(app, ["applications"])
+    assert result.exit_code == 0
+    assert "APP1" in result.stdout
+    assert "Trip" in result.stdout
+    assert "OPEN" in result.stdout
+
+    result = runner.invoke(app, ["colors"])
+    assert result.exit_code == 0
+    assert "Sun" in result.stdout
+    assert "#f00" in result.stdout
+
+
+@respx.mock
+def test_active_child_summary(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(_make_session(tmp_path)))
+    child = {
+        "id": "C1",
+        "name": "Ala",
+        "surname": "Nowak",
+        "preschool": {"name": "Sun"},
+        "group": None,
+        "dietCategory": {"name": "Vegan"},
+        "exclusions": [{"name": "nuts"}, {"name": None}],
+        "pinCode": "4321",
+    }
+    respx.post("https://backend.kidsview.pl/graphql").mock(
+        return_value=Response(200, json={"data": {"activeChild": child}})
+    )
+    result = runner.invoke(app, ["active-child"])
+
+    assert result.exit_code == 0
+    for text in ("C1", "Ala Nowak", "Sun", "Vegan", "nuts", "4321"):
+        assert text in result.stdout
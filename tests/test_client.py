@@ -1,10 +1,14 @@
+import asyncio
 import json
+from types import MappingProxyType
 
+import httpx
 import pytest
 import respx
 from httpx import Response
 
-from kidsview_cli.client import GraphQLClient
+from kidsview_cli import client as client_module
+from kidsview_cli.client import _PERSISTED_HASHES, GraphQLClient, encode_request, query_hash
 from kidsview_cli.config import Settings
 from kidsview_cli.context import Context
 from kidsview_cli.session import AuthTokens
@@ -83,3 +87,106 @@ async def test_graphql_builds_cookies_from_context_when_not_overridden() -> None
     assert "preschool=preX" in cookie_header
     assert "active_year=yearX" in cookie_header
     assert "locale=pl" in cookie_header
+
+
+@pytest.mark.asyncio()
+async def test_graphql_reuses_shared_http_client() -> None:
+    settings = Settings(api_url="https://backend.kidsview.pl/graphql")
+    tokens = AuthTokens(id_token="IDTOKEN", access_token="ACCESSTOKEN", refresh_token=None)
+
+    with respx.mock:
+        route = respx.post(settings.api_url).mock(
+            return_value=Response(200, json={"data": {"ok": True}})
+        )
+        async with httpx.AsyncClient() as http:
+            async with GraphQLClient(settings, tokens, http=http) as client:
+                await client.execute("query { ok }")
+                await client.execute("query { ok }")
+            # The shared client belongs to the caller and stays open.
+            assert not http.is_closed
+
+    assert route.call_count == 2
+
+
+def test_graphql_without_shared_client_closes_one_per_call(monkeypatch) -> None:
+    settings = Settings(api_url="https://backend.kidsview.pl/graphql")
+    tokens = AuthTokens(id_token="IDTOKEN", access_token="ACCESSTOKEN", refresh_token=None)
+    opened: list[httpx.AsyncClient] = []
+
+    def _new_http_client() -> httpx.AsyncClient:
+        opened.append(httpx.AsyncClient())
+        return opened[-1]
+
+    monkeypatch.setattr(client_module, "new_http_client", _new_http_client)
+    client = GraphQLClient(settings, tokens)
+
+    with respx.mock:
+        respx.post(settings.api_url).mock(return_value=Response(200, json={"data": {"ok": 1}}))
+        # Each asyncio.run has its own loop; a pool kept from the first would be unusable.
+        assert asyncio.run(client.execute("query { ok }")) == {"ok": 1}
+        assert asyncio.run(client.execute("query { ok }")) == {"ok": 1}
+
+    assert len(opened) == 2
+    assert all(http.is_closed for http in opened)
+
+
+def test_encode_request_round_trips_query_and_variables() -> None:
+    query = 'query { search(text: "żółw \\"x\\"") { id } }'
+    body = encode_request(query, MappingProxyType({"first": 5, "after": None}))
+
+    assert json.loads(body) == {"query": query, "variables": {"first": 5, "after": None}}
+    assert json.loads(encode_request(query)) == {"query": query, "variables": {}}
+
+
+@pytest.mark.asyncio()
+async def test_persisted_queries_send_hash_and_fall_back() -> None:
+    settings = Settings(api_url="https://backend.kidsview.pl/graphql", persisted_queries=True)
+    tokens = AuthTokens(id_token="IDTOKEN", access_token="ACCESSTOKEN", refresh_token=None)
+    query = "query { apq }"
+    _PERSISTED_HASHES.discard(query_hash(query))
+    not_found = {"errors": [{"message": "PersistedQueryNotFound"}]}
+
+    with respx.mock:
+        route = respx.post(settings.api_url).mock(
+            side_effect=[
+                Response(200, json={"data": {"ok": 1}}),
+                Response(200, json={"data": {"ok": 2}}),
+                Response(200, json=not_found),
+                Response(200, json={"data": {"ok": 3}}),
+            ]
+        )
+        async with GraphQLClient(settings, tokens) as client:
+            assert await client.execute(query) == {"ok": 1}
+            assert await client.execute(query) == {"ok": 2}
+            assert await client.execute(query) == {"ok": 3}
+
+    bodies = [json.loads(call.request.content) for call in route.calls]
+    sha = query_hash(query)
+    assert bodies[0]["query"] == query
+    assert bodies[0]["extensions"]["persistedQuery"]["sha256Hash"] == sha
+    assert "query" not in bodies[1] and "query" not in bodies[2]
+    assert bodies[3]["query"] == query
+
+
+@pytest.mark.asyncio()
+async def test_persisted_queries_fall_back_when_server_rejects_hash() -> None:
+    settings = Settings(api_url="https://backend.kidsview.pl/graphql", persisted_queries=True)
+    tokens = AuthTokens(id_token="IDTOKEN", access_token="ACCESSTOKEN", refresh_token=None)
+    query = "query { noApq }"
+    _PERSISTED_HASHES.discard(query_hash(query))
+
+    with respx.mock:
+        route = respx.post(settings.api_url).mock(
+            side_effect=[
+                Response(200, json={"data": {"ok": 1}}),
+                Response(400, text="Must provide query string"),
+                Response(200, json={"data": {"ok": 2}}),
+            ]
+        )
+        async with GraphQLClient(settings, tokens) as client:
+            assert await client.execute(query) == {"ok": 1}
+            assert await client.execute(query) == {"ok": 2}
+
+    bodies = [json.loads(call.request.content) for call in route.calls]
+    assert "query" not in bodies[1]
+    assert bodies[2]["query"] == query
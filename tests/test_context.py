@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 
 import respx
@@ -6,7 +7,7 @@ from typer.testing import CliRunner
 
 from kidsview_cli.cli import app
 from kidsview_cli.config import Settings
-from kidsview_cli.context import ContextStore
+from kidsview_cli.context import Context, ContextStore
 from kidsview_cli.session import AuthTokens, SessionStore
 
 runner = CliRunner()
@@ -91,9 +92,79 @@ def test_context_auto_interactive_prompts_and_saves(tmp_path: Path, monkeypatch)
     # Choose child2 (index 2), preschool pre2 (index 2), year2 (index 2)
     result = runner.invoke(app, ["context", "--auto", "--change"], input="2\n2\n2\n")
     assert result.exit_code == 0
+    # Piped output lists the options as plain numbered lines.
+    assert "2. 2025/26" in result.stdout
 
     ctx = ContextStore(settings.context_file).load()
     assert ctx is not None
     assert ctx.child_id == "child2"
     assert ctx.preschool_id == "pre2"
     assert ctx.year_id == "year2"
+
+
+@respx.mock
+def test_context_auto_with_known_preschool_uses_single_request(tmp_path: Path, monkeypatch) -> None:
+    settings = _make_session(tmp_path)
+    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(settings.session_file))
+    monkeypatch.setenv("KIDSVIEW_CONTEXT_FILE", str(settings.context_file))
+    ContextStore(settings.context_file).save(Context(preschool_id="pre1"))
+
+    payload = _mock_me([{"id": "child1", "name": "A"}], [{"id": "pre1", "name": "P1"}])
+    payload["data"]["years"] = [{"id": "year1", "displayName": "2024/25"}]
+    route = respx.post(settings.api_url).mock(return_value=Response(200, json=payload))
+
+    result = runner.invoke(app, ["context", "--auto"])
+    assert result.exit_code == 0
+    assert route.call_count == 1
+    assert "meAndYears" in route.calls.last.request.content.decode()
+
+    ctx = ContextStore(settings.context_file).load()
+    assert ctx is not None
+    assert ctx.child_id == "child1"
+    assert ctx.year_id == "year1"
+
+
+@respx.mock
+def test_context_auto_with_complete_context_skips_requests(tmp_path: Path, monkeypatch) -> None:
+    settings = _make_session(tmp_path)
+    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(settings.session_file))
+    monkeypatch.setenv("KIDSVIEW_CONTEXT_FILE", str(settings.context_file))
+    saved = Context(child_id="child1", preschool_id="pre1", year_id="year1")
+    ContextStore(settings.context_file).save(saved)
+    route = respx.post(settings.api_url).mock(return_value=Response(200, json={"data": {}}))
+
+    result = runner.invoke(app, ["context", "--auto"])
+    assert result.exit_code == 0
+    assert route.call_count == 0
+    assert ContextStore(settings.context_file).load() == saved
+
+
+def test_context_json_output(tmp_path: Path, monkeypatch) -> None:
+    settings = _make_session(tmp_path)
+    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(settings.session_file))
+    monkeypatch.setenv("KIDSVIEW_CONTEXT_FILE", str(settings.context_file))
+    saved = Context(child_id="child1", preschool_id="pre1", year_id="year1")
+    ContextStore(settings.context_file).save(saved)
+
+    result = runner.invoke(app, ["context", "--json"])
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == {"context": saved.model_dump()}
+
+
+def test_login_forgets_cached_child_name(tmp_path: Path, monkeypatch) -> None:
+    settings = _make_session(tmp_path)
+    monkeypatch.setenv("KIDSVIEW_SESSION_FILE", str(settings.session_file))
+    monkeypatch.setenv("KIDSVIEW_CONTEXT_FILE", str(settings.context_file))
+    ContextStore(settings.context_file).save(Context(child_id="c1", child_name="Ala Kot"))
+
+    async def fake_login(self, username: str, password: str) -> AuthTokens:
+        return AuthTokens(id_token="NEW", access_token="NEWACC")
+
+    monkeypatch.setattr("kidsview_cli.cli.AuthClient.login", fake_login)
+    result = runner.invoke(app, ["login", "--username", "u@example.com", "--password", "pw"])
+
+    assert result.exit_code == 0
+    ctx = ContextStore(settings.context_file).load()
+    assert ctx is not None
+    assert ctx.child_id == "c1"
+    assert ctx.child_name is None
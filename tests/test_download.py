@@ -1,6 +1,8 @@
 import asyncio
+import json
 from pathlib import Path
 
+import httpx
 import respx
 from httpx import Response
 
@@ -63,3 +65,124 @@ def test_download_all_skips_existing(tmp_path: Path) -> None:
     assert g2_dir.exists()
     files = sorted(p.name for p in g2_dir.iterdir())
     assert files == ["001.jpg", "002.jpg"]
+
+
+@respx.mock
+def test_download_all_reuses_given_client(tmp_path: Path) -> None:
+    settings = Settings()
+    tokens = AuthTokens(id_token="id", access_token="acc", refresh_token=None)
+    respx.post(settings.api_url).mock(
+        return_value=Response(
+            200,
+            json={
+                "data": {
+                    "galleries": {
+                        "edges": [
+                            {
+                                "node": {
+                                    "id": "g1",
+                                    "name": "G1",
+                                    "paginatedImages": {
+                                        "edges": [
+                                            {"node": {"imageUrl": "https://example.com/a.png"}}
+                                        ]
+                                    },
+                                }
+                            }
+                        ]
+                    }
+                }
+            },
+        )
+    )
+    respx.get("https://example.com/a.png").mock(return_value=Response(200, content=b"a"))
+
+    async def _go() -> tuple[list[Path], bool]:
+        async with httpx.AsyncClient() as http:
+            paths = await download_all(
+                settings=settings,
+                tokens=tokens,
+                context=None,
+                gallery_ids=["g1"],
+                output_dir=tmp_path,
+                http=http,
+            )
+            return paths, http.is_closed
+
+    downloaded, closed = asyncio.run(_go())
+    assert not closed
+    assert [p.name for p in downloaded] == ["G1 - g1"]
+    assert (downloaded[0] / "001.png").read_bytes() == b"a"
+
+
+@respx.mock
+def test_download_all_streams_pages_and_stops_when_found(tmp_path: Path) -> None:
+    settings = Settings()
+    tokens = AuthTokens(id_token="id", access_token="acc", refresh_token=None)
+
+    def page(gid: str, cursor: str) -> Response:
+        return Response(
+            200,
+            json={
+                "data": {
+                    "galleries": {
+                        "edges": [{"node": {"id": gid, "name": gid.upper()}}],
+                        "pageInfo": {"hasNextPage": True, "endCursor": cursor},
+                    }
+                }
+            },
+        )
+
+    route = respx.post(settings.api_url).mock(side_effect=[page("g1", "c1"), page("g2", "c2")])
+
+    downloaded = asyncio.run(
+        download_all(
+            settings=settings,
+            tokens=tokens,
+            context=None,
+            gallery_ids=["g2"],
+            output_dir=tmp_path,
+        )
+    )
+
+    assert [p.name for p in downloaded] == ["G2 - g2"]
+    assert route.call_count == 2
+    assert json.loads(route.calls[1].request.content)["variables"]["after"] == "c1"
+
+
+@respx.mock
+def test_download_all_cancels_other_galleries_on_failure(tmp_path: Path) -> None:
+    settings = Settings()
+    tokens = AuthTokens(id_token="id", access_token="acc", refresh_token=None)
+    galleries = [
+        {
+            "id": gid,
+            "name": gid.upper(),
+            "paginatedImages": {"edges": [{"node": {"imageUrl": f"https://example.com/{gid}"}}]},
+        }
+        for gid in ("g1", "g2")
+    ]
+
+    async def slow(request):
+        await asyncio.sleep(10)
+        return Response(200, content=b"late")
+
+    respx.get("https://example.com/g1").mock(return_value=Response(404))
+    respx.get("https://example.com/g2").mock(side_effect=slow)
+
+    async def _go() -> set[asyncio.Task]:
+        try:
+            await download_all(
+                settings=settings,
+                tokens=tokens,
+                context=None,
+                gallery_ids=[],
+                output_dir=tmp_path,
+                galleries=galleries,
+            )
+        except httpx.HTTPStatusError:
+            return asyncio.all_tasks() - {asyncio.current_task()}
+        raise AssertionError("expected the 404 to propagate")
+
+    assert asyncio.run(_go()) == set()
+    assert not (target_dir(tmp_path, "G2", "g2") / "001.jpg").exists()
@@ -20,6 +20,7 @@ def test_gallery_download_resolves_child_name(
     tokens = MagicMock()
     context = MagicMock()
     context.child_id = "child1"
+    context.child_name = None
     mock_env.return_value = (settings, tokens, context)
 
     # Mock me response with child name
@@ -33,7 +34,8 @@ def test_gallery_download_resolves_child_name(
     }
 
     # Run command
-    result = runner.invoke(app, ["gallery-download", "--id", "1"])
+    with patch("kidsview_cli.commands.galleries._remember_child_name") as mock_remember:
+        result = runner.invoke(app, ["gallery-download", "--id", "1"])
 
     assert result.exit_code == 0
 
@@ -42,6 +44,28 @@ def test_gallery_download_resolves_child_name(
     call_kwargs = mock_download.call_args[1]
     assert call_kwargs["child_name"] == "John Doe"
     assert call_kwargs["gallery_ids"] == ["1"]
+    mock_remember.assert_called_once_with(settings, context, "John Doe")
+
+
+@patch("kidsview_cli.commands.galleries._env")
+@patch("kidsview_cli.commands.galleries._fetch_me")
+@patch("kidsview_cli.commands.galleries.download_all")
+@patch("kidsview_cli.commands.galleries._run")
+def test_gallery_download_uses_cached_child_name(
+    mock_run, mock_download, mock_fetch_me, mock_env, tmp_path
+):
+    settings = MagicMock()
+    settings.download_dir = str(tmp_path)
+    context = MagicMock()
+    context.child_id = "child1"
+    context.child_name = "John Doe"
+    mock_env.return_value = (settings, MagicMock(), context)
+
+    result = runner.invoke(app, ["gallery-download", "--id", "1"])
+
+    assert result.exit_code == 0
+    mock_fetch_me.assert_not_called()
+    assert mock_download.call_args[1]["child_name"] == "John Doe"
 
 
 @patch("kidsview_cli.commands.galleries._env")
@@ -57,6 +81,7 @@ def test_gallery_download_fallback_child_id(
     tokens = MagicMock()
     context = MagicMock()
     context.child_id = "child1"
+    context.child_name = None
     mock_env.return_value = (settings, tokens, context)
 
     # Mock me response failing or empty
@@ -1,14 +1,32 @@
+import json
 from datetime import date, timedelta
-from unittest.mock import patch
+from unittest.mock import PropertyMock, patch
 
 import pytest
+import respx
 import typer
+from httpx import Response
 
+from kidsview_cli import helpers
 from kidsview_cli.auth import AuthError
 from kidsview_cli.client import ApiError
+from kidsview_cli.commands.calendar import _compute_range
 from kidsview_cli.config import Settings
-from kidsview_cli.helpers import execute_graphql, normalize_date, prompt_choice, prompt_multi_choice
-from kidsview_cli.session import AuthTokens
+from kidsview_cli.helpers import (
+    cell,
+    execute_graphql,
+    execute_graphql_many,
+    field_cells,
+    full_name,
+    load_session,
+    load_tokens,
+    normalize_date,
+    print_json,
+    prompt_choice,
+    prompt_multi_choice,
+    split_csv,
+)
+from kidsview_cli.session import AuthTokens, SessionStore
 
 
 def test_normalize_date():
@@ -20,6 +38,8 @@ def test_normalize_date():
     assert normalize_date("tomorrow") == tomorrow
     assert normalize_date("yesterday") == yesterday
     assert normalize_date("2023-01-01") == "2023-01-01"
+    assert normalize_date(" Tomorrow ", date(2024, 2, 28)) == "2024-02-29"
+    assert normalize_date("yesterday", date(2025, 1, 1)) == "2024-12-31"
 
 
 def test_prompt_multi_choice_parsing(capsys):
@@ -32,6 +52,8 @@ def test_prompt_multi_choice_parsing(capsys):
     # Valid multiple choice
     with patch("typer.prompt", return_value="1, 2"):
         assert prompt_multi_choice(options, "Title", "name") == ["1", "2"]
+    with patch("typer.prompt", return_value="2 1"):
+        assert prompt_multi_choice(options, "Title", "name") == ["2", "1"]
 
     # Out of range
     with patch("typer.prompt", return_value="3"), pytest.raises(typer.Exit):
@@ -113,3 +135,104 @@ def test_execute_graphql_retry_failure(mock_auth_cls, mock_gql_cls):
 
     with pytest.raises(typer.Exit):
         execute_graphql(settings, tokens, "query", {}, None)
+
+
+@respx.mock
+def test_execute_graphql_many_retries_failed_calls(tmp_path) -> None:
+    settings = Settings(session_file=tmp_path / "sess.json")
+    tokens = AuthTokens(id_token="ID", access_token="ACC", refresh_token=None)
+    seen: list[str] = []
+
+    def handler(request):
+        item = json.loads(request.content)["variables"]["id"]
+        seen.append(item)
+        if item == "b" and seen.count("b") == 1:
+            return Response(502, text="bad gateway")
+        return Response(200, json={"data": {"echo": item}})
+
+    respx.post(settings.api_url).mock(side_effect=handler)
+
+    variables = [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+    result = execute_graphql_many(settings, tokens, "mutation", variables, ctx=None)
+
+    assert result == [{"echo": "a"}, {"echo": "b"}, {"echo": "c"}]
+    assert sorted(seen) == ["a", "b", "b", "c"]
+
+
+def test_load_tokens_reads_session_file_once(tmp_path) -> None:
+    settings = Settings(session_file=tmp_path / "sess.json")
+    saved = AuthTokens(id_token="ID", access_token="ACC", refresh_token="REF")
+    SessionStore(settings.session_file).save(saved)
+
+    assert load_tokens(settings) == saved
+    settings.session_file.unlink()
+    assert load_tokens(settings) == saved
+
+    load_session.cache_clear()
+    with pytest.raises(typer.Exit):
+        load_tokens(settings)
+
+
+def test_print_table_splits_long_listings(monkeypatch) -> None:
+    printed = []
+    monkeypatch.setattr(helpers, "TABLE_CHUNK_ROWS", 2)
+    monkeypatch.setattr(helpers.console, "print", printed.append)
+    helpers.print_table("T", [(str(i),) for i in range(5)], ["N"])
+
+    assert [t.row_count for t in printed] == [2, 2, 1]
+    assert [t.title for t in printed] == ["T", None, None]
+
+
+def test_compute_range_month_edges() -> None:
+    assert _compute_range("", "", False, True, None, today=date(2024, 12, 15)) == (
+        "2024-12-01",
+        "2024-12-31",
+    )
+    assert _compute_range("", "", False, True, None, today=date(2024, 2, 10)) == (
+        "2024-02-01",
+        "2024-02-29",
+    )
+    assert _compute_range("", "", False, True, None, today=date(2025, 2, 10))[1] == "2025-02-28"
+
+
+def test_field_cells_follows_dotted_paths() -> None:
+    cells = field_cells("id", "month.startDate", "month.endDate")
+    assert cells({"id": 7, "month": {"startDate": "2025-01-01"}}) == ("7", "2025-01-01", "")
+    assert cells({"month": None}) == ("", "", "")
+
+
+def test_field_cells_flat_paths() -> None:
+    cells = field_cells("id", "name", "count")
+    assert cells({"id": 1, "name": "G", "count": None}) == ("1", "G", "")
+    assert cells({}) == ("", "", "")
+
+
+def test_split_csv_drops_blanks_and_spaces() -> None:
+    assert split_csv(" a, b,,c ") == ["a", "b", "c"]
+    assert split_csv("1 2,\t3") == ["1", "2", "3"]
+    assert split_csv("") == []
+    assert split_csv(None) == []
+
+
+def test_full_name_skips_missing_parts() -> None:
+    assert full_name({"name": "Jan", "surname": "Nowak"}) == "Jan Nowak"
+    assert full_name({"name": "Jan", "surname": None}) == "Jan"
+    assert full_name({"firstName": "Ala"}, "firstName", "lastName") == "Ala"
+    assert full_name({}) == ""
+
+
+def test_cell_keeps_strings_and_blanks_null() -> None:
+    text = "abc"
+    assert cell(text) is text
+    assert cell(None) == ""
+    assert cell(12) == "12"
+
+
+def test_print_json_is_compact_when_piped(capsysbinary) -> None:
+    print_json({"a": [1]})
+    assert capsysbinary.readouterr().out == b'{"a":[1]}\n'
+
+    with patch.object(type(helpers.console), "is_terminal", new_callable=PropertyMock) as tty:
+        tty.return_value = True
+        print_json({"a": [1]})
+    assert capsysbinary.readouterr().out == b'{\n  "a": [\n    1\n  ]\n}\n'
@@ -34,7 +34,8 @@ def test_required_queries_exist_and_have_expected_args() -> None:
         "usersForChat": set(),
         "groupsForChat": {"search"},
         "me": set(),
-        "notifications": {"pending", "first"},
+        # No type/isRead arguments: the CLI filters those client-side, page by page.
+        "notifications": {"pending", "first", "after"},
         "applications": set(),
         "currentDietForChild": set(),
         "calendar": {"dateFrom", "dateTo"},